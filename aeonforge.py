@@ -17,6 +17,9 @@ FIGURATION:
 As the personification of time itself, Chronos sets the temporal limits of an inquiry.
 '''
 class Chronos(QWidget):
+    # KNOWLEDGE: the resolutions (in minutes) we allow for sampling
+    cadences = [60, 15, 5, 1]
+
     def __init__(self):
         super().__init__()
         self.layout = QHBoxLayout()
@@ -54,6 +57,30 @@ class Chronos(QWidget):
 
         self.layout.addLayout(date_layout)
 
+        # Sampling inputs
+        cadence_layout = QVBoxLayout()
+        cadence_layout.setAlignment(Qt.AlignLeft)
+
+        resolution_layout = QHBoxLayout()
+        label_resolution = QLabel("Resolution:")
+        label_resolution.setSizePolicy(QSizePolicy.Maximum, QSizePolicy.Preferred)
+        resolution_layout.addWidget(label_resolution)
+
+        # KNOWLEDGE: the horologion (the hour-teller) sets how often, in minutes, we sample the arcs of the heavens
+        self.horologion = QComboBox()
+        for minutes in self.cadences:
+            self.horologion.addItem(f"{minutes} min", minutes)
+        self.horologion.setSizePolicy(QSizePolicy.Maximum, QSizePolicy.Preferred)
+        resolution_layout.addWidget(self.horologion)
+        cadence_layout.addLayout(resolution_layout)
+
+        # KNOWLEDGE: whether to keep to the hours, only sampling at the resolution around the horizon and culmination
+        self.kairotic = QCheckBox("Adaptive")
+        self.kairotic.setToolTip("Sample hourly, taking a closer look only where arcs cross the horizon or culminate")
+        cadence_layout.addWidget(self.kairotic)
+
+        self.layout.addLayout(cadence_layout)
+
         # Navigation buttons
         font = QFont()
         font.setPointSize(20)
@@ -93,6 +120,12 @@ class Chronos(QWidget):
         If a new aion begins then we  we attempt to fulfill our destiny through quest
         '''
         self.chronogenesis.dateChanged.connect(self._quest)
+        '''
+        IMPULSE:
+        If we change how closely we watch the passing hours, we see our destiny anew
+        '''
+        self.horologion.currentIndexChanged.connect(self._quest)
+        self.kairotic.toggled.connect(self._quest)
 
         self.setLayout(self.layout)
 
@@ -126,6 +159,16 @@ class Chronos(QWidget):
     def eschatos(self): 
         return self.arche_date + timedelta(days=self.aion-1)
 
+    # KNOWLEDGE: how often (in minutes) the arcs are sampled
+    @property
+    def cadence(self):
+        return self.horologion.currentData()
+
+    # KNOWLEDGE: whether the arcs are sampled adaptively (i.e. only closely at the moments that matter)
+    @property
+    def adaptive(self):
+        return self.kairotic.isChecked()
+
     '''
     BEHAVIOUR:
     A change in our destiny, our alloted time.
@@ -135,6 +178,77 @@ class Chronos(QWidget):
         new_destiny = min(999, max(1, new_destiny))
         self.moira.setValue(new_destiny)
 
+# --- Horae: Keepers of the Gates ---
+
+'''
+FIGURATION:
+The Horae were the goddesses of the seasons (and the hours) who kept the gates of Olympus, opening them only when it was proper to do so.
+Ours keep the gate between Chronos and The Observatory. Every flux of time asks for the quest to be fulfilled, but a burst of them (typing "365" into the duration, or holding down an arrow key) should only be fulfilled the once, for the latest state of time. So the Horae wait for a moment of patience before opening the gate; any request made while they wait supersedes the one before it.
+Should a burst go on and on, they lose patience eventually and open the gate anyway, so a held arrow key still shows us the days sliding by.
+They also keep a tally of the requests made versus the quests actually fulfilled, so we can see what their patience saves us.
+'''
+class Horae(QObject):
+    def __init__(self, telos, patience_ms=250, max_patience_ms=1000):
+        super().__init__()
+        # KNOWLEDGE: what lies beyond the gate
+        self.telos = telos
+        self.max_patience = max_patience_ms / 1000
+
+        self.gate = QTimer(self)
+        self.gate.setSingleShot(True)
+        self.gate.setInterval(patience_ms)
+        self.gate.timeout.connect(self._open)
+
+        # KNOWLEDGE: when the current burst of requests began (None if nobody is waiting)
+        self.waiting_since = None
+
+        self.requested = 0
+        self.fulfilled = 0
+        # KNOWLEDGE: requests overtaken by another whilst still waiting at the gate
+        self.superseded = 0
+
+    '''
+    IMPULSE:
+    A request to pass through the gate, which will be granted once things have settled down (superseding any request still waiting)
+    '''
+    def request(self):
+        self.requested += 1
+        now = time.perf_counter()
+        if self.waiting_since is None:
+            self.waiting_since = now
+        else:
+            self.superseded += 1
+
+        if now - self.waiting_since >= self.max_patience:
+            self._open()
+        else:
+            self.gate.start()
+
+    '''
+    IMPULSE:
+    A request that brooks no delay (e.g. a button press), which also supersedes any request still waiting
+    '''
+    def hasten(self):
+        self.requested += 1
+        if self.waiting_since is not None:
+            self.superseded += 1
+        self._open()
+
+    '''
+    MECHANISM:
+    Opens the gate for the latest request
+    '''
+    def _open(self):
+        self.gate.stop()
+        self.waiting_since = None
+        self.fulfilled += 1
+        self.telos()
+
+    # KNOWLEDGE: requests made versus quests fulfilled
+    @property
+    def tally(self):
+        return f"{self.fulfilled} of {self.requested} requests fulfilled ({self.superseded} superseded)"
+
 # --- Kairos: Provides provides us with the mechanics of time ---
 
 '''
@@ -165,6 +279,17 @@ class Kairos(Chronos):
     def get_day_band(cls, event):
         return cls.day_bands.get(event, "apocalypse")
 
+    '''
+    MECHANISM:
+    Holds a sampling resolution (in minutes) to account: it must step evenly through every hour, else the last samples of each day fall short of its end.
+    '''
+    @classmethod
+    def true_cadence(cls, minutes):
+        cadence = int(minutes)
+        if cadence < 1 or 60 % cadence:
+            raise ValueError(f"OOPS:: a resolution of {minutes} minutes doesn't step evenly through the hour (try one of {', '.join(map(str, cls.cadences))})")
+        return cadence
+
     '''
     MECHANISM:
     provides the universal time for a given offset from noon of a given date.
@@ -187,6 +312,15 @@ class Kairos(Chronos):
         dt_utc = cls.divine_universal_time(base_date, hour_offset)
         return dt_utc
 
+    '''
+    MECHANISM:
+    provides the universal time of noon for each of a run of days, starting from a given date.
+    This is all that Idmon needs from us to consult the almanac for a whole day range in one go; he counts the hours out from each noon himself (in Julian dates).
+    '''
+    @classmethod
+    def true_noons(cls, base_date, days):
+        return [cls.true_hour(base_date + timedelta(days=day), 0) for day in range(days)]
+
     '''
     MECHANISM:
     Tells us what time it is at a given time!
@@ -201,13 +335,11 @@ class Kairos(Chronos):
 
     '''
     MECHANISM:
-    Finds the (fractional) hours separation between two UTC times
+    The local time-of-day labels for every hour of the day that starts at noon on 'date' (which aren't always the same, thanks to daylight saving)
     '''
     @classmethod
-    def utc_hours_difference(cls, t0, t1):
-        t0_utc = cls.to_utc(t0, as_guardian=True) # let's be sure
-        t1_utc = cls.to_utc(t1, as_guardian=True) # let's be sure
-        return (t0_utc - t1_utc).total_seconds() / 3600
+    def hour_labels(cls, base_date):
+        return [cls.what_time_is_it(base_date, hour) for hour in range(25)]
 
     '''
     MECHANISM:
@@ -112,7 +112,7 @@ class ArtBoard(QWidget):
     '''
     MECHANISM:
     Extends the basic inscription tool so that (complex) arcs can be inscribed.
-    This tool adds one inscription for each arc to be displayed; we may have several arcs each day (e.g. all the planets) or we may end up with an arc for each of several days.
+    This tool adds one inscription for each arc to be displayed; we may have several arcs each day (e.g. all the planets) or we may end up with an arc for each of several days. All of them are bound into the one quire (see Quire), each in a leaf of its own.
     We create one such tool for each set of arcs we provide - i.e. 2 such tools: the lunar arcs and, the transit arcs.
     '''
     class InscribeArc(Inscriptions.Inscribe):
@@ -120,9 +120,33 @@ class ArtBoard(QWidget):
             super().__init__(scroll, title_render)
             self.layer = Layer(True, group, self)
 
-        def add_inscription(self, segments, colour_defs, arc, day, zorder=2):
-            inscription = self.make_arc_inscription(segments, colour_defs, arc, day, zorder)
-            super().add_inscription(inscription)
+        def add_inscription(self, segments, colours, arc, day, zorder=2):
+            return self.make_arc_inscription(segments, colours, arc, day, zorder)
+
+        '''
+        MECHANISM:
+        Discards an arc (the leaf it was bound in) from the inscription's quire
+        '''
+        def discard_inscription(self, leaf):
+            self.quire.discard(leaf)
+
+        '''
+        MECHANISM:
+        Lets go of the inscription's quire (along with every arc in it), for when the parchment is laid afresh; a new one is laid down with the next arc
+        '''
+        def clear_inscriptions(self):
+            self.veil.clear()
+            self.quire = None
+
+        '''
+        MECHANISM:
+        Shows the arcs (now and hereafter) as a density image of them all, or else as the arcs themselves (see Quire)
+        '''
+        def condense(self, condensed):
+            self.condensed = condensed
+            if self.quire is not None:
+                self.quire.condensed = condensed
+                self.quire.stale = True
 
     '''
     MECHANISM:
@@ -151,10 +175,36 @@ class ArtBoard(QWidget):
             extent = [[0,-90.0],[0,180.0]]
             for band in range(bands):
                 self.add_inscription(scroll.add_block(extent, self.band_decor[band], 0, 1)[0])
+            self.blocks = list(self.veil)
+
+            # KNOWLEDGE: the woven background (see Tapestry) colours each minute by its daylight level, from true night (0) up to full day (4); it takes the place of the blocks when rastered
+            self.rastered = False
+            self.tapestry = scroll.add_tapestry([self.band_decor[level] for level in (4, 3, 2, 1, 0)], 1)
+            self.tapestry.set_visible(False)
 
         def update_inscription(self, extent, day, band=0):
             self.make_bg_inscription(extent, day, band)
-            self.scroll.set_block(self.veil[band], extent)
+            self.scroll.set_block(self.blocks[band], extent)
+
+        '''
+        MECHANISM:
+        Shows the day bands of every day (of the days given), woven together, or else just those of the last day as blocks; whichever isn't shown is hidden
+        '''
+        def raster(self, rastered, days):
+            self.rastered = rastered
+            self.tapestry.warp(days)
+            self.scroll.inscription_visibility(False, self.veil)
+            self.veil = [self.tapestry] if rastered else self.blocks
+            self.draw_veil()
+
+        '''
+        MECHANISM:
+        Weaves a day's bands (where each ends, and its daylight level) into its row of the tapestry; its animation steps reveal the row an hour at a time
+        '''
+        def weave_day(self, day, ends, levels):
+            self.tapestry.weave(day, ends, levels)
+            hours = np.arange(24)
+            self.steps_by_day[day].record(Inscriptions.DAYROW, len(hours), hour=hours, band=hours, zorder=1)
 
     '''
     MECHANISM:
@@ -203,6 +253,9 @@ class ArtBoard(QWidget):
             self.grid_colour = grid_colour
             self.scroll.set_grid(self.visible, self.grid_colour, alpha=0.2)
 
+        def marks(self):
+            return self.scroll.gridlines()
+
         def show_hide(self, show=True):
             self.scroll.set_grid(show and self.visible, self.grid_colour, alpha=0.2)
 
@@ -231,9 +284,27 @@ class ArtBoard(QWidget):
         self.plot_layout.addWidget(self.scroll.canvas)
         self.setLayout(self.plot_layout)
 
-        # and for the animation utility
+        # and for the animation utility; which plays out on-screen to the beat of a metronome (see Metronome), so it can be paused and its tempo changed as it plays
         self.animate = QPushButton("Animate")
         self.animate.clicked.connect(self.do_animation)
+        # KNOWLEDGE: whilst the days of a chart are still coming in there is nothing whole to animate (see wipe and inscribed)
+        self.inscribing = False
+
+        self.metronome = Metronome()
+        self.metronome.finished.connect(self.conclude_animation)
+        self.frame_out = None
+
+        self.pause = QPushButton("Pause")
+        self.pause.setEnabled(False)
+        self.pause.clicked.connect(self.pause_animation)
+
+        self.tempo = QDoubleSpinBox()
+        self.tempo.setRange(0.25, 8.0)
+        self.tempo.setSingleStep(0.25)
+        self.tempo.setValue(1.0)
+        self.tempo.setSuffix("x")
+        self.tempo.setToolTip("Animation speed (1x is 2 days a second)")
+        self.tempo.valueChanged.connect(self.metronome.set_tempo)
 
         self.layout = QHBoxLayout()
 
@@ -259,6 +330,8 @@ class ArtBoard(QWidget):
 
         self.layout.addLayout(self.grid.layer.layout)
         self.layout.addWidget(self.animate)
+        self.layout.addWidget(self.pause)
+        self.layout.addWidget(self.tempo)
         self.grid.draw_veil()
 
         '''
@@ -272,11 +345,25 @@ class ArtBoard(QWidget):
         self.inscriptions = Inscriptions(self.scroll)
         self.animation_filter = None
 
+        # KNOWLEDGE: every layer, by name; for when they are set from outside the GUI (e.g. the command line)
+        self.layers = {"bands": self.background, "threshold": self.threshold, "grid": self.grid}
+        self.layers.update(self.arc_sets)
+        self.scroll.laminate(self.layers.values())
+
+        # KNOWLEDGE: beyond this many days the arcs are shown as density images (see Quire) rather than drawn one by one
+        self.density_days = 60
+        # KNOWLEDGE: whether the day bands of every day are woven into the background (see Tapestry), rather than just those of the last day being shown
+        self.twilight_raster = False
+
     '''
     MECHANISM:
     Cleans-up the ArtBoard when we are ready to start plotting a new presentation
     '''
     def wipe(self, arc_name, date, days):
+        # KNOWLEDGE: any animation still playing is of the chart we are about to wipe
+        self.metronome.stop()
+        self.inscribing = True
+        self.animate.setEnabled(False)
         self.arc_sets['main'].layer.label = arc_name
         self.date = date
         self.days = days
@@ -284,6 +371,17 @@ class ArtBoard(QWidget):
 
         for inscription_set in self.inscription_sets:
             inscription_set.steps_by_day.clear()
+        for arc_set in self.arc_sets.values():
+            arc_set.condense(days > self.density_days)
+        self.background.raster(self.twilight_raster, days)
+
+    '''
+    MECHANISM:
+    The days of the chart are all in (or all we shall get), so it may be animated
+    '''
+    def inscribed(self):
+        self.inscribing = False
+        self.animate.setEnabled(self.frame_out is None)
 
     '''
     MECHANISM:
@@ -330,9 +428,21 @@ class ArtBoard(QWidget):
 
         return current_title
 
+    '''
+    MECHANISM:
+    Shows or hides layers by name (keeping their toggles in step), without redrawing; see layers for the names
+    '''
+    def set_layers(self, visibility):
+        for name, visible in visibility.items():
+            inscriber = self.layers[name]
+            inscriber.layer.toggle.blockSignals(True)
+            inscriber.layer.toggle.setChecked(visible)
+            inscriber.layer.toggle.blockSignals(False)
+            inscriber.set_visibility(visible, redraw=False)
+
     '''
     BEHAVIOUR:
-    Initiates an animation, allowing a video render to be produced also.
+    Initiates an animation, allowing a video render to be produced also. Either way the animation plays out to the beat of the metronome, leaving the GUI free meanwhile; the animate button is ours again once it concludes.
     '''
     def do_animation(self):
         # !!! we oughta disable all dashboard controls
@@ -342,7 +452,7 @@ class ArtBoard(QWidget):
         outfile, _ = QFileDialog.getSaveFileName(
             self, "Save Animation As", "", "Video Files (*.mp4);;All Files (*)"
         )
-        max_days = len(self.inscriptions.all_animation_steps) # which is number of days
+        max_days = len(self.inscriptions.chronicle) # which is number of days
         day_cap = max_days
 
         dialog = self.AnimationModeDialog(day_cap, self)
@@ -352,18 +462,82 @@ class ArtBoard(QWidget):
             self.animate.setEnabled(True)
             return
 
+        self.play_animation(outfile, day_cap)
+
+    '''
+    KNOWLEDGE:
+    The day cap an animation of the current chart will actually use (no more than the days charted), and how many turns of the day it takes (see DayTracker.turns)
+    '''
+    def animation_turns(self, day_cap=None):
+        max_days = len(self.inscriptions.chronicle)
+        day_cap = min(day_cap or max_days, max_days)
+        return day_cap, Inscriptions.DayTracker.turns(day_cap, max_days)
+
+    '''
+    MECHANISM:
+    Sets the stage for an animation of the current chart: where its frames are put out (see FrameOut) and the performance itself (see Inscriptions.perform), showing at most day_cap days of arcs at a time.
+    We can be asked for just some of the animation's turns of the day (see DayTracker.turns), e.g. to record it in segments; only the first segment leads in (with a second of the empty chart) and only the last leads out.
+    '''
+    def stage_animation(self, outfile=None, day_cap=None, encoding=None, turns=None):
+        max_days = len(self.inscriptions.chronicle) # which is number of days
+        day_cap, last_turn = self.animation_turns(day_cap)
+
         self.animation_filter._pre_animate(self.background)
 
         day_tracker = Inscriptions.DayTracker(day_cap, max_days)
 
-        frame_out = FrameOut(self.scroll, outfile)
+        self.frame_out = FrameOut(
+            self.scroll, outfile, encoding,
+            lead_in=turns is None or turns.start == 0,
+            lead_out=turns is None or turns.stop >= last_turn
+        )
 
-        self.inscriptions.animate(frame_out, day_tracker, self.background.veil, self.animation_filter)
+        return self.inscriptions.perform(day_tracker, self.background.veil, self.animation_filter, turns)
 
-        frame_out.close()
-        self.animation_filter._post_animate()
+    '''
+    BEHAVIOUR:
+    Records the animation of the current chart (to a video file, if given one, encoded as asked; see Reel) there and then, every frame of it; no dialogs nor GUI, so it serves the command line just as well as the GUI.
+    '''
+    def record_animation(self, outfile=None, day_cap=None, encoding=None, turns=None):
+        for _ in self.stage_animation(outfile, day_cap, encoding, turns):
+            self.frame_out.capture()
+        self.conclude_animation()
+
+    '''
+    BEHAVIOUR:
+    Plays the animation of the current chart to the beat of the metronome: on-screen in time with the clock or, given a video file, every frame as fast as they come; returning straight away either way.
+    '''
+    def play_animation(self, outfile=None, day_cap=None, encoding=None):
+        self.metronome.stop()
+        frames = self.stage_animation(outfile, day_cap, encoding)
+        self.metronome.play(frames, self.frame_out, paced=outfile is None)
+        self.pause.setText("Pause")
+        self.pause.setEnabled(True)
+
+    '''
+    MECHANISM:
+    Pauses (or resumes) the animation playing
+    '''
+    def pause_animation(self):
+        if self.metronome.paused:
+            self.metronome.resume()
+            self.pause.setText("Pause")
+        else:
+            self.metronome.pause()
+            self.pause.setText("Resume")
 
-        self.animate.setEnabled(True)
+    '''
+    MECHANISM:
+    Concludes an animation, however it ended: the parchment is restored, as are the layers shown before it began
+    '''
+    def conclude_animation(self):
+        if self.frame_out is None:
+            return
+        self.frame_out.close()
+        self.frame_out = None
+        self.animation_filter._post_animate()
+        self.pause.setEnabled(False)
+        self.animate.setEnabled(not self.inscribing)
 
 '''
 AFFORDANCE:
@@ -380,15 +554,16 @@ class AnimationFilter:
     def _pre_animate(self, bg_layer):
         self.bg_layer = bg_layer
         self.pre_animate_states = {}
+        # KNOWLEDGE: no need to show the chart as each layer is hidden (nor shown again, after); the animation lays a fresh parchment regardless
         for i, layer in enumerate(self.layers):
             self.pre_animate_states[layer] = layer.visible
             if layer.visible and layer != self.bg_layer:
-                layer.set_visibility(False)
+                layer.set_visibility(False, redraw=False)
 
     def _post_animate(self):
         for i, layer in enumerate(self.layers):
             if self.pre_animate_states[layer]:
-                layer.set_visibility(True)
+                layer.set_visibility(True, redraw=False)
         self.scroll.redraw(idle=True)
 
     def is_animated(self, layer):
@@ -397,34 +572,169 @@ class AnimationFilter:
         return True
 
 
-#NB we still make direct matplotlib calls  on the writer object, probs wanna change that!!!
+'''
+AFFORDANCE:
+Puts out the frames of an animation: either to the screen, or to a video file.
+Either way, each frame is revealed on the parchment's palimpsest (only what changed being redrawn, see Palimpsest); when recording, the reel then takes the frame just as it was drawn (see Reel), encoded as asked. When (and whether) each frame is put out on-screen is for the metronome to say (see Metronome).
+'''
 class FrameOut:
-    def __init__(self, scroll, outfile):
+    def __init__(self, scroll, outfile, encoding=None, lead_in=True, lead_out=True):
         self.scroll = scroll
         self.fps = 50
-        self.framerate = 1 / self.fps
         self.writer = None
+        self.lead_out = lead_out
 
         if outfile:
-            self.writer = self.scroll.fresh_parchment(outfile, self.fps)
-            self.scroll.redraw()
-            for _ in range(self.fps):
-                self.writer.grab_frame()
+            self.writer = self.scroll.fresh_parchment(outfile, self.fps, encoding)
+            self.scroll.palimpsest.hold()
+            if lead_in:
+                self.scroll.palimpsest.reveal()
+                for _ in range(self.fps):
+                    self.writer.grab_frame()
         else:
             self.scroll.fresh_parchment()
-
-        self.now = time.perf_counter()
+            self.scroll.palimpsest.hold()
 
     def capture(self):
-        self.scroll.redraw()
+        self.scroll.palimpsest.reveal()
         if self.writer:
             self.writer.grab_frame()
-        else:
-            next_frametime = self.now + self.framerate
-            sleep_time = max(0, next_frametime - self.now)
-            self.now = next_frametime
-            time.sleep(sleep_time)
 
     def close(self):
-        self.scroll.restore_parchment(self.writer, self.fps)
+        self.scroll.palimpsest.release()
+        self.scroll.restore_parchment(self.writer, self.fps if self.lead_out else 0)
+
+'''
+AFFORDANCE:
+Keeps time for an animation on-screen, so it plays at its proper pace (at 50 frames a second, a day's 25 frames take half a second; so 2 days a second) however long each frame takes to show; and plays it to the beat of a timer, rather than in a loop of its own, so the GUI carries on meanwhile.
+Which frame is due is reckoned by the clock, from when it was last set going (started, resumed or given a new tempo), rather than by counting beats; so slow frames don't leave us ever further behind. Should we fall behind, the frames in between are still performed (their steps all play out on the chart) but only the one that's due is shown, the palimpsest gathering up whatever the frames passed over changed (see Palimpsest). Should we be ahead, we wait for the next beat.
+Recording to video has no clock to keep (every frame is wanted), so then the frames are simply played out as fast as they come, a beat's worth at a time.
+'''
+class Metronome(QObject):
+    finished = pyqtSignal()
+
+    def __init__(self):
+        super().__init__()
+        self.beat = QTimer(self)
+        self.beat.setTimerType(Qt.PreciseTimer)
+        self.beat.timeout.connect(self._tick)
+
+        # KNOWLEDGE: the performance playing (see Inscriptions.perform), where its frames are put out, and how many of its frames have been performed (and how many of those passed over)
+        self.frames = None
+        self.frame_out = None
+        self.played = 0
+        self.passed_over = 0
+
+        # KNOWLEDGE: how fast we play (1.0 being the animation's own frame rate), whether we keep to the clock at all, and when (and at which frame) the clock was last set going
+        self.tempo = 1.0
+        self.paced = True
+        self.set_going = None
+        self.paused = False
+
+        # KNOWLEDGE: showing a frame lets the GUI have its moment, so a beat can come round again before the last one is done with
+        self.beating = False
+
+    @property
+    def playing(self):
+        return self.frames is not None
 
+    '''
+    IMPULSE:
+    Plays the performance given, putting its frames out as it goes; stopping anything already playing
+    '''
+    def play(self, frames, frame_out, paced=True):
+        self.stop()
+        self.frames = frames
+        self.frame_out = frame_out
+        self.paced = paced
+        self.played = 0
+        self.passed_over = 0
+        self.paused = False
+        self._set_going()
+        self.beat.start(round(1000 / frame_out.fps) if paced else 0)
+
+    def _set_going(self):
+        self.set_going = (time.perf_counter(), self.played)
+
+    '''
+    IMPULSE:
+    Pauses, resumes or changes the tempo of the performance (setting the clock going afresh, from the frame we are at)
+    '''
+    def pause(self):
+        if self.playing and not self.paused:
+            self.paused = True
+            self.beat.stop()
+
+    def resume(self):
+        if self.playing and self.paused:
+            self.paused = False
+            self._set_going()
+            self.beat.start()
+
+    def set_tempo(self, tempo):
+        self.tempo = tempo
+        if self.playing:
+            self._set_going()
+
+    '''
+    IMPULSE:
+    Stops the performance playing (if any), however far it got, and says so
+    '''
+    def stop(self):
+        if not self.playing:
+            return
+        self.beat.stop()
+        self.frames.close()
+        self.frames = None
+        self.paused = False
+        self.finished.emit()
+
+    '''
+    KNOWLEDGE:
+    The frame that is due by the clock (counting from the first frame, as 0)
+    '''
+    @property
+    def due(self):
+        since, played = self.set_going
+        return played + int((time.perf_counter() - since) * self.frame_out.fps * self.tempo)
+
+    def _tick(self):
+        if self.beating or not self.playing:
+            return
+        self.beating = True
+        try:
+            if self.paced:
+                self._keep_time()
+            else:
+                self._keep_going()
+        except StopIteration:
+            self.stop()
+        finally:
+            self.beating = False
+
+    '''
+    MECHANISM:
+    Performs every frame up to the one that's due (if we aren't already there) and shows just that one; showing the last frame performed even if the performance ends along the way
+    '''
+    def _keep_time(self):
+        due = self.due
+        if self.played > due:
+            return
+        self.passed_over += due - self.played
+        try:
+            while self.played <= due:
+                next(self.frames)
+                self.played += 1
+        finally:
+            self.frame_out.capture()
+
+    '''
+    MECHANISM:
+    Performs and puts out every frame, for as long as a beat lasts at the animation's own frame rate
+    '''
+    def _keep_going(self):
+        until = time.perf_counter() + 1 / self.frame_out.fps
+        while self.playing and not self.paused and time.perf_counter() < until:
+            next(self.frames)
+            self.played += 1
+            self.frame_out.capture()
@@ -1,6 +1,7 @@
 from continuum import *
 
 from artboard import ArtBoard
+from inscriptions import Inscriptions
 from parchment import Parchment
 
 '''
@@ -19,10 +20,15 @@ In this quest he creates the charts that answer the queries presented in The Obs
 '''
 class Astraeus():
     def __init__(self):
-        # KNOWLEDGE: a look-up table that lets us plot the moon's arc relative to its illumination
-        self.greyscale = np.array([f"#{i:02x}{i:02x}{i:02x}" for i in range(256)])
+        # KNOWLEDGE: a look-up table (RGBA) that lets us plot the moon's arc relative to its illumination
+        levels = np.arange(256) / 255
+        self.greyscale = np.column_stack([levels, levels, levels, np.ones(256)])
 
         self.scroll = Parchment()
+
+        # KNOWLEDGE: what was last looked at, from where, and the inscriptions made for each of its days
+        self.sighting = None
+        self.folios = {}
         
         # KNOWLEDGE: we always allow for the lunar arc, plus 1 or more celsatial bodies
         arc_sets = {}
@@ -41,43 +47,63 @@ class Astraeus():
             '#e5cd45',  # Venus
             '#92cc7c'   # Mercury
         ]
+        # KNOWLEDGE: ...and the same as a look-up table (RGBA), whose alpha is ours to set
+        self.target_rgba = np.array([to_rgba(colour) for colour in self.target_colours])
 
     '''
     MECHANISM:
     Sets-up the ArtBoard with a fresh parchment for the new plot (clearing any animation)
+    Unless, that is, we are looking at the same things from the same place (the same sighting) as last time. Then any days we have already inscribed that fall within the new date range stay on the parchment, and only those that have fallen out of range are erased; so sliding the range along by a day costs us a day's inscription, not the whole lot.
     '''
-    def commence_presentation(self, arc_name, date, days):
+    def commence_presentation(self, arc_name, date, days, sighting=None):
         self.artboard.wipe(arc_name, date, days)
-        self.inscriptions.all_animation_steps = defaultdict(lambda: defaultdict(list))
-        self.scroll.fresh_parchment()
+        self.inscriptions.chronicle = defaultdict(list)
+
+        if sighting is None or sighting != self.sighting:
+            self.folios = {}
+            for inscriber in self.artboard.arc_sets.values():
+                inscriber.clear_inscriptions()
+            self.scroll.fresh_parchment()
+        else:
+            in_range = {date + timedelta(days=day) for day in range(days)}
+            for folio_date in [folio_date for folio_date in self.folios if folio_date not in in_range]:
+                self.erase_day(self.folios.pop(folio_date))
+
+        self.sighting = sighting
 
     def _collate_animation(self, day, inscriber):
-        for hour, steps in inscriber.steps_by_day[day].items():
-            self.inscriptions.all_animation_steps[day][hour].extend(steps)
+        self.inscriptions.chronicle[day].append(inscriber.steps_by_day[day])
+
+    '''
+    MECHANISM:
+    Erases the transit arcs of a single (inscribed) day from the parchment, i.e. from the quires that show them
+    '''
+    def erase_day(self, folio):
+        for inscriber, inscription in folio["inscriptions"]:
+            inscriber.discard_inscription(inscription)
+
+    '''
+    MECHANISM:
+    Re-files the animation steps (ledgers) of an already inscribed day under its (new) place in the day range
+    '''
+    def refile_day(self, day, folio):
+        for inscriber, ledger in folio["steps"].items():
+            inscriber.steps_by_day[day] = ledger
 
     '''
     BEHAVIOUR:
     Draws the entire plot for a single day: the background day bands, each transit arc, the title and the axes.
     The title includes the (overall) day range and so needs updating for each plotted day, as does the x-axis as the time-of-day hour labels change when we have daylight saving.
+    If the day's transit arcs are already inscribed (kept from the last presentation) they are simply re-filed rather than drawn again. Each day's inscriptions and animation steps are kept in a folio, keyed by date, for just that purpose.
     '''
     def draw_day(self, day, local_hours, arc_data, moon_arc, moon_illumination, twilight_data):
         self.draw_day_bands(day, twilight_data, self.artboard.background)
 
-        # note that we expect all arcs to provide 24hrs of hourly data
-        for arc_num, (arc, inscriber) in enumerate(
-            [(moon_arc, self.artboard.arc_sets['lunar'])] + 
-            [(arc_data[i], self.artboard.arc_sets['main']) for i in range(len(arc_data))]
-        ):
-            arc_display_num = arc_num - 1
-            if arc_num > 0 and len(arc_data) == 1:
-                arc_display_num = 4
-            self.plot_arc_day(
-                day=day,
-                arc_num=arc_display_num,
-                inscriber=inscriber,
-                arc_data=arc,
-                illumination_data=moon_illumination
-            )
+        date = self.artboard.date + timedelta(days=day)
+        if date in self.folios:
+            self.refile_day(day, self.folios[date])
+        else:
+            self.folios[date] = self.inscribe_day(day, arc_data, moon_arc, moon_illumination)
 
         self._collate_animation(day, self.artboard.background)
         for key in self.artboard.arc_sets.keys():
@@ -92,39 +118,74 @@ class Astraeus():
         self.artboard.day = day
         current_title = self.artboard.render_title()
 
-        self.inscriptions.all_animation_steps[day][0].append({
-            "parent": self,
-            "arc": 0,
-            "day": day,
-            "type": "title",
-            "title": current_title,
-            "chart_band": 0,
-            "zorder": 1
-        })
+        ledger = Inscriptions.Ledger(self)
+        ledger.record(Inscriptions.TITLE, 1, texts=[current_title], first=0, hour=0, zorder=1)
 
         self.scroll.xaxis.ticklabels(local_hours)
-        for hour, label in enumerate(local_hours):
-            self.inscriptions.all_animation_steps[day][hour].append({
-                "parent": self,
-                "arc": 0,
-                "day": day,
-                "type": "ticks",
-                "label": label,
-                "index": hour,
-                "chart_band": hour,
-                "zorder": 1
-            })
+        hours = np.arange(len(local_hours))
+        ledger.record(Inscriptions.TICKS, len(local_hours), texts=list(local_hours), first=hours, hour=hours, band=hours, zorder=1)
+
+        self.inscriptions.chronicle[day].append(ledger)
+
+    '''
+    BEHAVIOUR:
+    Draws a single day as it arrives and shows it (as far as its layers are visible) the next time the GUI gets a moment; so a long presentation appears bit by bit, rather than all at once at the end.
+    '''
+    def present_day(self, day, local_hours, arc_data, moon_arc, moon_illumination, twilight_data):
+        self.draw_day(day, local_hours, arc_data, moon_arc, moon_illumination, twilight_data)
+        self.scroll.refresh()
+
+    '''
+    MECHANISM:
+    Inscribes the transit arcs (lunar and otherwise) of a single day, returning the day's folio: its inscriptions (the leaves of the quires they are bound in) and animation steps
+    '''
+    def inscribe_day(self, day, arc_data, moon_arc, moon_illumination):
+        inscribers = list(self.artboard.arc_sets.values())
+        inscriptions = []
+
+        # note that we expect all arcs to provide 24hrs of data, though not necessarily hourly (nor evenly spaced)
+        for arc_num, (arc, inscriber) in enumerate(
+            [(moon_arc, self.artboard.arc_sets['lunar'])] + 
+            [(arc_data[i], self.artboard.arc_sets['main']) for i in range(len(arc_data))]
+        ):
+            arc_display_num = arc_num - 1
+            if arc_num > 0 and len(arc_data) == 1:
+                arc_display_num = 4
+            inscription = self.plot_arc_day(
+                day=day,
+                arc_num=arc_display_num,
+                inscriber=inscriber,
+                arc_data=arc,
+                illumination_data=moon_illumination
+            )
+            inscriptions.append((inscriber, inscription))
+
+        return {
+            "inscriptions": inscriptions,
+            "steps": {inscriber: inscriber.steps_by_day[day] for inscriber in inscribers}
+        }
 
     '''
     MECHANISM:
-    Adds the day/twilight colour-bands to the inscriptions
+    Adds the day/twilight colour-bands to the inscriptions, as presented by Idmon: arrays of band starts, ends and event codes for the day
     '''
     def draw_day_bands(self, day, twilight_data, inscriber):
         # ylim is not dependant on what we plot, its is chosen via the UI
         # so we can use fixed limits for the height of our twilight indication
         bottom, top = -90.0, 90.0
-        for j, band in enumerate(twilight_data):
-            start, end, event = band
+        starts, ends, events = twilight_data
+
+        # a woven background takes every band of every day, each in its own row
+        if inscriber.rastered:
+            inscriber.weave_day(day, ends, events)
+            return
+
+        # we keep the faith that a day has no more than 9 bands, but close to the arctic circle the sun can dip back into twilight just before the day's window closes; any such stragglers are absorbed by the final band we can show
+        bands = len(inscriber.blocks)
+        if len(starts) > bands:
+            starts, ends = starts[:bands], np.append(ends[:bands - 1], ends[-1])
+
+        for j, (start, end) in enumerate(zip(starts, ends)):
             width = end - start
             height = top - bottom
             extent = [(start,bottom),(width,height)]
@@ -132,30 +193,27 @@ class Astraeus():
 
     '''
     MECHANISM:
-    Adds (all) the transit arcs to the inscriptions for a given day
+    Adds (all) the transit arcs to the inscriptions for a given day.
+    An arc may be sampled more often than the moon-illumination (or at different hours altogether, when sampled adaptively), so the illumination is read off at each of the arc's own hours.
+    The segments and their colours are made whole, as arrays, rather than one by one; the colours being looked up (as RGBA) from the greyscale or target colour tables.
+    Returns the inscription made (the leaf the arc is bound in), for the day's folio.
     '''
     def plot_arc_day(self, day, arc_num, inscriber, arc_data, illumination_data):
-        segments, colour_defs = [], []
         hours, altitudes = arc_data
-        for h1, h2, alt1, alt2, illum in zip(
-            hours[:-1], hours[1:], 
-            altitudes[:-1], altitudes[1:], 
-            illumination_data[:-1]
-        ):
-            segments.append([[h1, alt1], [h2, alt2]])
+        points = np.column_stack([hours, altitudes]).astype(float)
+        # KNOWLEDGE: segment i runs from point i to point i+1, taking the illumination (and so the colour) at its start
+        segments = np.stack([points[:-1], points[1:]], axis=1)
+        illumination = np.interp(points[:-1, 0], *illumination_data)
 
-            if arc_num < 0: # ie. lunar arc
-                # Use greyscale based on illumination
-                grey = self.greyscale[int(illum * 255)]
-                colour_defs.append((grey, None))
-            else:
-                colour_index = arc_num % len(self.target_colours)
-                colour = self.target_colours[colour_index]
-                # Fade target arc based on moon brightness
-                alpha = 0.6 - (illum * 0.4)
-                colour_defs.append((colour, alpha))
+        if arc_num < 0: # ie. lunar arc
+            # Use greyscale based on illumination
+            colours = self.greyscale[(illumination * 255).astype(int)]
+        else:
+            colours = np.repeat(self.target_rgba[arc_num % len(self.target_rgba)][None], len(segments), axis=0)
+            # Fade target arc based on moon brightness
+            colours[:, 3] = 0.6 - (illumination * 0.4)
 
-        inscriber.add_inscription(segments, colour_defs, arc=max(0,arc_num), day=day, zorder=2)
+        return inscriber.add_inscription(segments, colours, arc=max(0,arc_num), day=day, zorder=2)
 
     '''
     MECHANISM:
@@ -168,6 +226,7 @@ class Astraeus():
         for key in self.artboard.arc_sets.keys():
             self.artboard.arc_sets[key].draw_veil()
         self.artboard.threshold.draw_veil()
+        self.artboard.inscribed()
 
         # AND show it all
         # ---------------
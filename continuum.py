@@ -16,20 +16,59 @@ I know, its unusual to promote the use of 'import *' (and you may well hate the
 # === PART 1: CORE ============================================================
 # CONTINUUM: we use the standard sys module to get CLI arguments and issue exit codes.
 import sys
+# CONTINUUM: the scriptorium takes its commissions from the command line, or by the batch from a manifest (JSON or TOML); reporting back how long each took (as JSON)
+import argparse
+import json
+import tomllib
+# CONTINUUM: the oracle at Delphi answers petitions over HTTP (from localhost only), each in a thread of its own; its charts are drawn into memory rather than to file
+import io
+import queue
+import threading
+from http.server import (
+    BaseHTTPRequestHandler,
+    ThreadingHTTPServer
+)
+from urllib.parse import (
+    parse_qs,
+    urlparse
+)
 # CONTINUUM: at the end of an animation we have a lot of matplotlib objects to clean-up, at which point we perform an explicit garbage collection. Not really something we should HAVE to do, but, well - matplotlib...
 import gc
-# CONTINUUM: The standard time module provides 'sleep', for when we want to pace an interactive animation
+# CONTINUUM: The standard time module provides 'perf_counter', by which an interactive animation keeps time
 import time
+# CONTINUUM: The standard os module lets us make a home for Mnemosyne's memories
+import os
+# CONTINUUM: an animation recorded in segments keeps them in a temporary folder until they are joined
+import shutil
+import tempfile
+# CONTINUUM: Mnemosyne keeps her memories in a sqlite scroll, each memory being a pickled set of numpy arrays
+import sqlite3
+import pickle
+# CONTINUUM: she opens (and closes) her scroll for each consultation as a context
+from contextlib import (
+    contextmanager
+)
+# CONTINUUM: the Sibyls each prophesy in a process of their own, spawned (rather than forked) from a pool; and Delphi's petitioners wait on a Future for their chart to be drawn
+import multiprocessing
+from concurrent.futures import (
+    Future,
+    ProcessPoolExecutor,
+    as_completed
+)
 # CONTINUUM: The standard math module provides 'ceil', which helps to chunk time into 1 hour bands
 import math
-# CONTINUUM: The NUMPY module is used a convenience to create small sequences, when needed - there no serious vectorised operations in this app
+# CONTINUUM: The NUMPY module is used a convenience to create small sequences, when needed - and for the vectorised lifting when Idmon divines whole day ranges and catalogues of targets in one go
 import numpy as np
 # CONTINUUM: we use the convenience of the defaultdict to ensure we can always index every hour of every day in a given day range, since conceptually those indices are always valid (days always have 24 hours!) - even if we don't happen to have any data for a given time.
+# CONTINUUM: ...and the OrderedDict keeps Delphi's treasury in the order its offerings were last asked for; while the deque lets the animation expire its oldest arcs as cheaply as it adds the newest
 from collections import (
-    defaultdict
+    OrderedDict,
+    defaultdict,
+    deque
 )
 # CONTINUUM: Dates and times pervade in this application, but you can pretty much always expect them to be standard datetime objects - EXCEPT where Idmon needs to work in Julian dates, but that's a complexity he keeps to himselff...
 from datetime import (
+    date,
     datetime, 
     timedelta
 )
@@ -50,6 +89,16 @@ from skyfield.almanac import (
     find_discrete, 
     sunrise_sunset
 )
+# CONTINUUM: when we observe a whole catalogue of fixed stars in one go we lean on skyfield's own relativistic and vector helpers, rather than its (one-star-at-a-time) observe path
+from skyfield.relativity import (
+    add_aberration
+)
+from skyfield.functions import (
+    length_of
+)
+from skyfield.constants import (
+    C_AUDAY
+)
 
 
 # === PART 3: UI ==============================================================
@@ -81,9 +130,14 @@ from PyQt5.QtGui import (
     QFont, 
     QKeySequence
 )
+# CONTINUUM: the oracle is consulted in a thread of its own, reporting back through signals; and timers let us hold back a flurry of queries
 from PyQt5.QtCore import (
     QDate, 
-    Qt 
+    QObject, 
+    QThread, 
+    QTimer, 
+    Qt, 
+    pyqtSignal
 )
 
 
@@ -99,8 +153,11 @@ from matplotlib.backends.backend_agg import (
 )
 
 # core plotting tools
-# CONTINUUM: provides the (FFMPEG) video writer
-import matplotlib.animation as animation
+# CONTINUUM: video is written by piping raw frames into FFMPEG (wherever matplotlib has been told to find it), from a thread of its own
+import subprocess
+from matplotlib import (
+    rcParams
+)
 # CONTINUUM: only required when we come to release canvas memory
 import matplotlib.pyplot as plt
 
@@ -108,20 +165,33 @@ import matplotlib.pyplot as plt
 from matplotlib.figure import (
     Figure
 )
-# CONTINUUM: All of our actual plotted arcs are created as line collections, which helps when we want to animate the chart
+# CONTINUUM: All of our actual plotted arcs are created as line collections, which helps when we want to animate the chart; each day's segments being kept as paths of their own, so they can be bound into (and dropped from) a layer's single collection as the days come and go
 from matplotlib.collections import (
     LineCollection
 )
+from matplotlib.path import (
+    Path
+)
+from itertools import (
+    compress
+)
 # CONTINUUM: the background visualisation of daylight/twilight bands is achieved by adding rectangles (behind the transit arcs) as so-called patches.
 from matplotlib.patches import (
     Rectangle
 )
+# CONTINUUM: over very long day ranges an arc layer is shown as a density image of its arcs, rather than every arc being drawn; and the day bands of every day can be woven into a single (indexed colour) image
+from matplotlib.image import (
+    AxesImage
+)
 # CONTINUUM: we use a single font family, but at a variety of sizes
 from matplotlib.font_manager import (
     FontProperties
 )
 # CONTINUUM: we use colours with transparency when plotting the transit arcs, inversely relative to the moon illumination (which makes celestial objects less visible!).
+# CONTINUUM: ...and a woven background looks its colours up by the daylight level of each minute
 from matplotlib.colors import (
+    ListedColormap,
+    NoNorm,
     to_rgba
 )
 
@@ -0,0 +1,356 @@
+from continuum import *
+'''
+THROUGHLINE:
+Delphi is where the oracle was consulted by anyone who made the journey; ours is consulted over HTTP, so that a chart can be embedded in a web page (the intranet dashboard, say) without anybody launching The Observatory.
+It only listens on localhost, and it only knows two petitions:
+- /chart?lat=..&lon=..&date=..&days=..&target=.. answers with the chart, as a PNG
+- /data?...(the same)...&format=json|npz answers with the arcs and twilight bands themselves
+
+A few Idmons are kept awake (each having loaded the almanac the once) to divine whatever is asked, and every answer is kept in the treasury for a while, so the same petition is answered straight away the next time it is made.
+Charts are drawn by the scribe in the main thread (Qt insists on it); the petitions themselves are each heard in a thread of their own.
+'''
+
+from aeonforge import Kairos
+from scriptorium import Scribe, open_scriptorium
+from transits import Idmon, Tiphys
+
+# --- Treasury: Keeper of the Offerings ---
+'''
+FIGURATION:
+The treasuries at Delphi held the offerings the city states made to the oracle. Ours holds the answers Delphi has given (as they were given, i.e. as bytes), keyed by the petition that asked for them; but only so many bytes' worth: once full, whatever was asked for least recently is let go.
+Petitions are heard in threads of their own, so the treasury is kept under lock.
+'''
+class Treasury:
+    def __init__(self, max_bytes=64 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.offerings = OrderedDict()
+        self.held_bytes = 0
+        self.lock = threading.Lock()
+
+    '''
+    MECHANISM:
+    The offering made for a petition (if it is still held), which becomes the most recently asked for
+    '''
+    def recall(self, petition):
+        with self.lock:
+            offering = self.offerings.get(petition)
+            if offering is not None:
+                self.offerings.move_to_end(petition)
+            return offering
+
+    '''
+    MECHANISM:
+    Keeps an offering (content_type, body) for a petition, letting go of the least recently asked for until it all fits
+    '''
+    def keep(self, petition, offering):
+        size = len(offering[1])
+        if size > self.max_bytes:
+            return
+        with self.lock:
+            if petition in self.offerings:
+                self.held_bytes -= len(self.offerings.pop(petition)[1])
+            self.offerings[petition] = offering
+            self.held_bytes += size
+            while self.held_bytes > self.max_bytes:
+                _, forgotten = self.offerings.popitem(last=False)
+                self.held_bytes -= len(forgotten[1])
+
+# --- Pythia: The Oracle at Delphi ---
+'''
+FIGURATION:
+The Pythia was the priestess who gave voice to the oracle at Delphi. She keeps a few Idmons awake (so the almanac is never reloaded for a petition) and a treasury of what she has already said; whatever needs drawing she hands to the scribe, in the main thread, and waits on.
+'''
+class Pythia(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, port=8642, seers=None, fast_stars=False, memory_path='./skyquest-cache/almanac.sqlite', max_bytes=64 * 1024 * 1024):
+        # KNOWLEDGE: localhost only, we aren't about to answer to the whole world
+        super().__init__(("127.0.0.1", port), Petitioner)
+
+        # KNOWLEDGE: the Idmons that are kept awake, taken by a petition for as long as it needs one (and then returned). They share Mnemosyne's scroll, which any thread may consult.
+        self.seers = queue.Queue()
+        for _ in range(seers or os.cpu_count()):
+            self.seers.put(Idmon(memory_path=memory_path, fast_stars=fast_stars))
+
+        self.treasury = Treasury(max_bytes)
+
+        # KNOWLEDGE: the drawings waiting on the scribe, each with the Future its petitioner waits on
+        self.drawings = queue.Queue()
+
+    '''
+    MECHANISM:
+    Borrows a waking Idmon for as long as a petition needs him (waiting for one to be free, if need be)
+    '''
+    @contextmanager
+    def seer(self):
+        idmon = self.seers.get()
+        try:
+            yield idmon
+        finally:
+            self.seers.put(idmon)
+
+    '''
+    MECHANISM:
+    Has the scribe (in the main thread) draw something, waiting for it to be done; the drawing is any callable taking a scribe
+    '''
+    def drawn(self, drawing):
+        promised = Future()
+        self.drawings.put((drawing, promised))
+        return promised.result()
+
+    '''
+    BEHAVIOUR:
+    Gives voice to the oracle: petitions are heard (in threads of their own) while the main thread sees to the drawing, until we are interrupted.
+    Each chart gets a scribe of his own (they are cheap to find), so nothing of one petition's presentation lingers on into the next.
+    '''
+    def prophesy(self):
+        hearing = threading.Thread(target=self.serve_forever, daemon=True)
+        hearing.start()
+        try:
+            while True:
+                drawing, promised = self.drawings.get()
+                if not promised.set_running_or_notify_cancel():
+                    continue
+                try:
+                    promised.set_result(drawing(Scribe()))
+                except Exception as failure:
+                    promised.set_exception(failure)
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self.shutdown()
+            self.server_close()
+
+# --- Petitioner: One Who Consults the Oracle ---
+'''
+FIGURATION:
+Each petitioner has a single question for the oracle, asked as an HTTP GET. The question is read (and checked) from the query string, and answered from the treasury if it has been asked before.
+'''
+class Petitioner(BaseHTTPRequestHandler):
+    # KNOWLEDGE: what the oracle answers to, and how (see chart and data)
+    petitions = ("/chart", "/data")
+
+    def do_GET(self):
+        asked = urlparse(self.path)
+        if asked.path not in self.petitions:
+            return self.answer(404, "text/plain", b"OOPS:: Delphi only answers /chart or /data\n")
+
+        try:
+            petition = self.petition(asked.path, parse_qs(asked.query))
+        except ValueError as confusion:
+            return self.answer(400, "text/plain", f"OOPS:: {confusion}\n".encode())
+
+        treasury = self.server.treasury
+        offering = treasury.recall(petition)
+        if offering is None:
+            try:
+                offering = self.chart(petition) if asked.path == "/chart" else self.data(petition)
+            except Exception as failure:
+                return self.answer(500, "text/plain", f"OOPS:: {type(failure).__name__}: {failure}\n".encode())
+            treasury.keep(petition, offering)
+
+        self.answer(200, *offering)
+
+    '''
+    MECHANISM:
+    Sends an answer back to the petitioner
+    '''
+    def answer(self, status, content_type, body):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    '''
+    KNOWLEDGE:
+    A petition, read from the query string: lat and lon are required; date (today), days (7), target (Planets, may be repeated), resolution (60 minutes), adaptive, hide (a layer, may be repeated), altitudes (min,max), threshold and format (json or npz, for data) are as on the scriptorium's command line.
+    Everything is normalised (into a tuple) so that the same petition, however it was phrased, is kept just the once in the treasury.
+    '''
+    @staticmethod
+    def petition(path, query):
+        def one(name, default=None):
+            return query[name][-1] if name in query else default
+
+        if "lat" not in query or "lon" not in query:
+            raise ValueError("lat and lon are required")
+
+        # KNOWLEDGE: a vantage must be somewhere on the earth (which nan and inf are not, failing every comparison)
+        latitude, longitude = float(query["lat"][-1]), float(query["lon"][-1])
+        if not -90 <= latitude <= 90:
+            raise ValueError("lat must be -90..90 degrees")
+        if not -180 <= longitude <= 180:
+            raise ValueError("lon must be -180..180 degrees")
+
+        targets = tuple(dict.fromkeys(query.get("target", ["Planets"])))
+        unknown = [target for target in targets if target not in Tiphys.targets]
+        if unknown:
+            raise ValueError(f"we don't know how to look at {', '.join(unknown)}")
+
+        hidden = tuple(sorted(set(query.get("hide", []))))
+        unknown = [layer for layer in hidden if layer not in ("bands", "lunar", "main", "threshold", "grid")]
+        if unknown:
+            raise ValueError(f"there is no {', '.join(unknown)} layer to hide")
+
+        days = int(one("days", 7))
+        if not 1 <= days <= 999:
+            raise ValueError("days must be 1..999")
+
+        altitudes = one("altitudes")
+        if altitudes is not None:
+            altitudes = tuple(float(altitude) for altitude in altitudes.split(","))
+            if len(altitudes) != 2:
+                raise ValueError("altitudes must be given as min,max")
+
+        try:
+            cadence = Kairos.true_cadence(one("resolution", 60))
+        except ValueError:
+            raise ValueError(f"resolution must be a whole number of minutes dividing the hour, such as {', '.join(map(str, Kairos.cadences))}") from None
+
+        threshold = one("threshold")
+        data_format = one("format", "json") if path == "/data" else None
+        if data_format not in (None, "json", "npz"):
+            raise ValueError("format must be json or npz")
+
+        return (
+            path,
+            latitude,
+            longitude,
+            date.fromisoformat(one("date", date.today().isoformat())),
+            days,
+            targets,
+            cadence,
+            one("adaptive", "false").lower() in ("1", "true", "yes"),
+            hidden,
+            altitudes,
+            None if threshold is None else float(threshold),
+            data_format
+        )
+
+    '''
+    MECHANISM:
+    Divines a petition's prophecies with whichever Idmon is free; providing them (in day order) along with the destinations they were divined for.
+    Targets can overlap (Planets and Mars, say), but each destination is divined just the once, so that every arc answered is named for what it is the arc of.
+    '''
+    def divined(self, petition):
+        _, lat, lon, first_date, days, targets, cadence, adaptive = petition[:8]
+        # KNOWLEDGE: keyed by name, each destination keeps its place from when it first came up
+        destinations = list({destination["name"]: destination for name in targets for destination in Tiphys.destinations(name)}.values())
+        with self.server.seer() as idmon:
+            prophecies = idmon.divine_range({"latitude": lat, "longitude": lon}, first_date, days, destinations, cadence=cadence, adaptive=adaptive)
+        return destinations, prophecies
+
+    '''
+    BEHAVIOUR:
+    Answers with the chart, as a PNG: the prophecies are divined here (in the petitioner's thread) and only the drawing is left to the scribe
+    '''
+    def chart(self, petition):
+        first_date, days = petition[3:5]
+        hidden, altitudes, threshold = petition[8:11]
+        destinations, prophecies = self.divined(petition)
+
+        def drawing(scribe):
+            scribe.transcribe(
+                first_date, days, destinations, enumerate(prophecies),
+                layers={layer: False for layer in hidden}, altitudes=altitudes, threshold=threshold
+            )
+            png = io.BytesIO()
+            scribe.save_chart(png, format="png")
+            return png.getvalue()
+
+        return "image/png", self.server.drawn(drawing)
+
+    '''
+    BEHAVIOUR:
+    Answers with the arcs and twilight bands, day by day, as JSON or as NPZ (see the two below)
+    '''
+    def data(self, petition):
+        destinations, prophecies = self.divined(petition)
+        first_date, days = petition[3:5]
+        dates = [first_date + timedelta(days=day) for day in range(days)]
+        if petition[-1] == "npz":
+            return "application/octet-stream", self.as_npz(dates, destinations, prophecies)
+        return "application/json", self.as_json(dates, destinations, prophecies)
+
+    '''
+    KNOWLEDGE:
+    The data as JSON: each arc (and the moon's illumination) is given per day as its own hours (from local noon) and values, since adaptively sampled arcs needn't share their hours; the twilight as each day's bands (from and to, in hours from noon).
+    '''
+    @staticmethod
+    def as_json(dates, destinations, prophecies):
+        def sampled(arc, values="altitudes"):
+            hours, measured = arc
+            return {"hours": np.asarray(hours).tolist(), values: np.asarray(measured).tolist()}
+
+        revealed = {
+            "dates": [day_date.isoformat() for day_date in dates],
+            "moon": [sampled(moon_arc) for moon_arc, _, _, _ in prophecies],
+            "illumination": [sampled(illumination, "values") for _, illumination, _, _ in prophecies],
+            "targets": {
+                destination["name"]: [sampled(target_arcs[i]) for _, _, target_arcs, _ in prophecies]
+                for i, destination in enumerate(destinations)
+            },
+            "twilight": [
+                [{"from": float(start), "to": float(end), "band": Kairos.get_day_band(int(code))} for start, end, code in zip(*twilight)]
+                for _, _, _, twilight in prophecies
+            ]
+        }
+        return json.dumps(revealed).encode()
+
+    '''
+    KNOWLEDGE:
+    The data as NPZ, for those who would rather have the arrays. Per-day arrays of differing lengths are run together, with an offsets array marking where each day starts (so day d of the moon is moon_hours[moon_offsets[d]:moon_offsets[d + 1]]). Targets are numbered in the order of target_names.
+    '''
+    @staticmethod
+    def as_npz(dates, destinations, prophecies):
+        arrays = {
+            "dates": np.array(dates, dtype="datetime64[D]"),
+            "target_names": np.array([destination["name"] for destination in destinations])
+        }
+
+        def run_together(name, per_day, fields):
+            lengths = [len(day_arrays[0]) for day_arrays in per_day]
+            arrays[f"{name}_offsets"] = np.concatenate(([0], np.cumsum(lengths))).astype(int)
+            for field, column in zip(fields, zip(*per_day)):
+                arrays[f"{name}_{field}"] = np.concatenate(column) if column else np.array([])
+
+        run_together("moon", [moon_arc for moon_arc, _, _, _ in prophecies], ("hours", "altitudes"))
+        run_together("illumination", [illumination for _, illumination, _, _ in prophecies], ("hours", "values"))
+        for i in range(len(destinations)):
+            run_together(f"target{i}", [target_arcs[i] for _, _, target_arcs, _ in prophecies], ("hours", "altitudes"))
+        run_together("twilight", [twilight for _, _, _, twilight in prophecies], ("from", "to", "codes"))
+
+        packed = io.BytesIO()
+        np.savez_compressed(packed, **arrays)
+        return packed.getvalue()
+
+    # KNOWLEDGE: the petitions are heard quietly, Delphi isn't one for gossip
+    def log_message(self, format, *args):
+        pass
+
+'''
+KNOWLEDGE:
+How Delphi is to be opened from the command line
+'''
+def parse_opening(args):
+    parser = argparse.ArgumentParser(description="Answers for SkyQuest charts (PNG) and data (JSON/NPZ) over HTTP, on localhost only")
+    parser.add_argument("--port", type=int, default=8642, help="port to listen on (default 8642)")
+    parser.add_argument("--seers", type=int, help="how many Idmons to keep awake, i.e. petitions divined at once (default one per core)")
+    parser.add_argument("--fast-stars", action="store_true", help="glance at fixed stars rather than a full reduction")
+    parser.add_argument("--cache-mb", type=int, default=64, help="most megabytes of answers to keep (default 64)")
+    return parser.parse_args(args)
+
+'''
+BEHAVIOUR:
+Opens Delphi to petitioners, until interrupted
+'''
+def main(args=None):
+    opening = parse_opening(sys.argv[1:] if args is None else args)
+    app = open_scriptorium()
+
+    pythia = Pythia(opening.port, opening.seers, opening.fast_stars, max_bytes=opening.cache_mb * 1024 * 1024)
+    print(f"Delphi is listening at http://127.0.0.1:{opening.port}/chart and /data")
+    pythia.prophesy()
+
+if __name__ == "__main__":
+    main()
@@ -34,7 +34,10 @@ class Inscriptions():
             self.title_render = title_render
 
             self.veil = []
-            self.steps_by_day = defaultdict(lambda: defaultdict(list))
+            # KNOWLEDGE: where the transit arcs (if any) are gathered, see make_arc_inscription
+            self.quire = None
+            self.condensed = False
+            self.steps_by_day = defaultdict(lambda: Inscriptions.Ledger(self))
 
         '''
         MECHANISM:
@@ -53,38 +56,40 @@ class Inscriptions():
 
         '''
         MECHANISM:
-        Adds segemented lines to the animation view, returning an inscription set that can then also be added to the veil - i.e. presumes the data is already suitably segmented (by the hour), which it will be when it comes to transit arcs that are derived on an hourly basis.
+        Adds segemented lines to the animation view - i.e. presumes the data is already suitably segmented, which it will be when it comes to transit arcs. Those needn't be hourly: each segment is animated in the hour (chart band) that it starts in, however many of them that hour holds.
+        The lines themselves (an array of n segments, and their n colours as RGBA) are gathered into the inscription's quire (its veil, see Quire), which is laid down with the first of them; returning the leaf they are bound in.
         '''
 
-        def make_arc_inscription(self, segments, colour_defs, arc, day, zorder):
+        def make_arc_inscription(self, segments, colours, arc, day, zorder):
             linewidths = 4
-            inscription, colours = self.scroll.add_lines(segments, colour_defs, linewidths, zorder)
-
-            colour = colours[-1]
-            for i, segment in enumerate(segments):
-                if i < len(colours):
-                    colour = colours[i]
-
-                chart_band = int(segment[0][0])
-                step = {
-                    "parent": self,
-                    "arc": arc,
-                    "day": day,
-                    "segment": segment,
-                    "color": colour,
-                    "linewidth": linewidths,
-                    "type": "line",
-                    "chart_band": chart_band,
-                    "zorder": zorder
-                }
-                self.steps_by_day[day][chart_band].append(step)
+            if self.quire is None:
+                self.quire = self.scroll.add_quire(linewidths, zorder)
+                self.quire.condensed = self.condensed
+                self.scroll.inscription_visibility(self.visible, [self.quire])
+                self.veil.append(self.quire)
+            inscription = self.scroll.gather_lines(self.quire, segments, colours)
+
+            # KNOWLEDGE: an arc's segments run end to start, so its n segments share n+1 vertices; segment i being vertices i and i+1
+            if len(segments):
+                count = len(segments)
+                self.steps_by_day[day].record(
+                    Inscriptions.LINE, count,
+                    vertices=np.vstack([segments[:, 0], segments[-1:, 1]]),
+                    first=np.arange(count),
+                    hour=segments[:, 0, 0].astype(int),
+                    arc=arc,
+                    opening=np.arange(count) == 0,
+                    rgba=colours,
+                    width=linewidths,
+                    zorder=zorder
+                )
 
             return inscription
 
         '''
         MECHANISM:
         Creates the animation steps for the background. These either grow the day bands from nothing to full width (day zero) or else shuffles the boundary between the day bands (on subsequent days).
-        Note that the inscriptions themselves are already added, here we create the animation steps that adjust them.
+        Note that the inscriptions themselves are already added, here we create the animation steps that adjust them. Each step's extent is kept as a pair of vertices: [[start, bottom], [width, height]].
         '''
         def make_bg_inscription(self, extent, day, band):
             zorder = 1
@@ -96,36 +101,31 @@ class Inscriptions():
                 this_width = min (total_width, 1 - (start - int(start)))
                 start_band = int(start)
                 end_band = int(start + total_width)
+                extents = []
                 for chart_band in range(start_band, end_band + 1):
-                    animated_extent = [[start, extent[0][1]], [this_width, extent[1][1]]]
-
-                    step = {
-                        "parent": self,
-                        "arc": 0,
-                        "day": day,
-                        "type": "dayband",
-                        "band": band,
-                        "extent": animated_extent,
-                        "chart_band": chart_band,
-                        "zorder": zorder
-                    }
-
-                    self.steps_by_day[day][chart_band].append(step)
+                    extents += [[start, extent[0][1]], [this_width, extent[1][1]]]
                     this_width = min(this_width + 1.0, total_width)
 
+                count = end_band + 1 - start_band
+                self.steps_by_day[day].record(
+                    Inscriptions.DAYBAND, count,
+                    vertices=np.array(extents, dtype=float),
+                    first=np.arange(count) * 2,
+                    hour=np.arange(start_band, end_band + 1),
+                    band=band,
+                    zorder=zorder
+                )
+
             else:
                 chart_band = int(extent[0][0] + extent[1][0])
-                step = {
-                    "parent": self,
-                    "arc": 0,
-                    "day": day,
-                    "type": "bandshift",
-                    "band": band,
-                    "extent": extent,
-                    "chart_band": chart_band,
-                    "zorder": zorder
-                }
-                self.steps_by_day[day][chart_band].append(step)
+                self.steps_by_day[day].record(
+                    Inscriptions.BANDSHIFT, 1,
+                    vertices=np.array(extent, dtype=float),
+                    first=0,
+                    hour=chart_band,
+                    band=band,
+                    zorder=zorder
+                )
                 
         '''
         MECHANISM:
@@ -137,7 +137,7 @@ class Inscriptions():
                 self.title_render()
             self.draw_veil()
             if redraw:
-                self.scroll.redraw()
+                self.scroll.recompose()
 
         '''
         MECHANISM:
@@ -146,6 +146,13 @@ class Inscriptions():
         def toggle_visibility(self):
             self.set_visibility(not self.visible)
 
+        '''
+        KNOWLEDGE:
+        The marks this inscription shows or hides: its veil
+        '''
+        def marks(self):
+            return self.veil
+
         '''
         SKILL:
         Directs the parchment to make or erase the marks of this veil (i.e avoids direct low-level calls into matplotlib at this point)
@@ -156,10 +163,126 @@ class Inscriptions():
             self.scroll.inscription_visibility(self.visible, self.veil)
 
 
+    '''
+    KNOWLEDGE:
+    The kinds of animation step, and the record each step is kept as. Where a step's geometry (an arc's segment, a band's extent) or text (a title, a tick label) lives elsewhere, first is its offset there; a woven day (see Tapestry) needs neither, its row being the day and its hour the band
+    '''
+    TITLE, TICKS, LINE, DAYBAND, BANDSHIFT, DAYROW = range(6)
+
+    STEP = np.dtype([
+        ("kind", np.uint8),
+        ("layer", np.int16),
+        ("arc", np.int16),
+        ("day", np.int32),
+        ("hour", np.int16),
+        ("band", np.int16),
+        ("first", np.int32),
+        ("opening", np.bool_),
+        ("zorder", np.int8),
+        ("width", np.float32),
+        ("rgba", np.float32, 4)
+    ])
+
+    '''
+    AFFORDANCE:
+    A ledger holds one day's animation steps for one inscriber (its parent): a run of step records for each thing inscribed (an arc, a band's growth or shift, the title, the tick labels), each run with its own vertices or texts.
+    The day isn't written in the ledger but in where it is filed; so a day kept from the last presentation is re-filed under its new place in the day range without being touched.
+    '''
+    class Ledger:
+        def __init__(self, parent):
+            self.parent = parent
+            self.entries = []
+
+        '''
+        MECHANISM:
+        Records a run of count steps of a kind; the fields (hour, arc, first and so on) being either one value for the lot or one for each step
+        '''
+        def record(self, kind, count, vertices=None, texts=None, **fields):
+            steps = np.zeros(count, dtype=Inscriptions.STEP)
+            steps["kind"] = kind
+            for field, value in fields.items():
+                steps[field] = value
+            self.entries.append((steps, vertices, texts))
+
+    '''
+    AFFORDANCE:
+    The animation, compiled: every step of every day held column by column, in the order they are played (by day, then hour, then as they were inscribed), along with the vertices and texts they refer to and the parents (layers) they belong to.
+    '''
+    class Timeline:
+        def __init__(self, steps, vertices, texts, layers):
+            self.kind = steps["kind"]
+            self.layer = steps["layer"]
+            self.arc = steps["arc"]
+            self.day = steps["day"]
+            self.hour = steps["hour"]
+            self.band = steps["band"]
+            self.first = steps["first"]
+            self.opening = steps["opening"]
+            self.zorder = steps["zorder"]
+            self.width = steps["width"]
+            self.rgba = steps["rgba"]
+
+            self.vertices = vertices
+            self.texts = texts
+            self.layers = layers
+
+            # KNOWLEDGE: where each hour of each day begins and ends amongst the steps
+            days = int(self.day[-1]) + 1 if len(self.day) else 0
+            self.bounds = np.searchsorted(self.day.astype(np.int64) * 25 + self.hour, np.arange(days * 25 + 1))
+
+        '''
+        MECHANISM:
+        The steps of an hour of a day, field by field, as plain python values (which are a good deal quicker to dispatch on than numpy's)
+        '''
+        def steps(self, day, hour):
+            at = day * 25 + hour
+            if at + 1 >= len(self.bounds):
+                return []
+            span = slice(self.bounds[at], self.bounds[at + 1])
+            return zip(
+                self.kind[span].tolist(), self.layer[span].tolist(), self.arc[span].tolist(),
+                self.band[span].tolist(), self.first[span].tolist(), self.opening[span].tolist(),
+                self.width[span].tolist(), self.zorder[span].tolist(), self.rgba[span].tolist()
+            )
+
     def __init__(self, scroll):
         self.scroll = scroll
 
-        self.all_animation_steps = defaultdict(lambda: defaultdict(list))
+        # KNOWLEDGE: the ledgers filed for each day, in the order their steps are played
+        self.chronicle = defaultdict(list)
+
+    '''
+    MECHANISM:
+    Compiles the chronicle into a timeline, ready to animate
+    '''
+    def compile(self):
+        layers, runs, vertices, texts = [], [], [], []
+        vertex_count = 0
+        for day in range(len(self.chronicle)):
+            for ledger in self.chronicle[day]:
+                if ledger.parent not in layers:
+                    layers.append(ledger.parent)
+                layer = layers.index(ledger.parent)
+
+                for steps, run_vertices, run_texts in ledger.entries:
+                    steps = steps.copy()
+                    steps["day"] = day
+                    steps["layer"] = layer
+                    if run_texts is not None:
+                        steps["first"] += len(texts)
+                        texts.extend(run_texts)
+                    elif run_vertices is not None:
+                        steps["first"] += vertex_count
+                        vertices.append(run_vertices)
+                        vertex_count += len(run_vertices)
+                    runs.append(steps)
+
+        steps = np.concatenate(runs) if runs else np.zeros(0, dtype=self.STEP)
+        # KNOWLEDGE: only the 25 hours of the chart are played; and lexsort is stable, so the steps of an hour keep the order they were filed in
+        steps = steps[(steps["hour"] >= 0) & (steps["hour"] < 25)]
+        steps = steps[np.lexsort((steps["hour"], steps["day"]))]
+        vertices = np.concatenate(vertices) if vertices else np.zeros((0, 2))
+        return self.Timeline(steps, vertices, texts, layers)
 
     '''
     AFFORDANCE:
@@ -209,69 +332,106 @@ class Inscriptions():
         def final_day(self):
             return self.end_of_days and self.day_cap == 0
 
+        '''
+        KNOWLEDGE:
+        How many turns of the day (25 frames each) an animation takes, unwind period included
+        '''
+        @classmethod
+        def turns(cls, day_cap, days):
+            tracker = cls(day_cap, days)
+            turns = 0
+            while tracker.more_days:
+                turns += 1
+                tracker.step_day()
+            return turns
+
     '''
     AFFORDANCE:
     An intermediary between the animator and the PARCHMENT.
     Collects references to the marks that are made so they can be progressively removed later if required.
+    The marks needn't be copied anywhere as they grow and decay: each day's arc is played out of consecutive vertices of the (compiled) timeline, so its mark is only ever a window onto them; growing it moves the window's end on a vertex, expiring it moves the start.
     '''
     class ArcLimiter:
-        def __init__(self, scroll):
+        def __init__(self, scroll, vertices):
             self.scroll = scroll
-            self.current_collections = defaultdict(lambda: {
-                "parent": None,
-                "arc": 0,
-                "collections": []
-            })
+            self.vertices = vertices
+            # KNOWLEDGE: for each (parent, arc), the marks of its days' arcs as they stand, oldest first: [collection, start, end, day] windows onto the vertices
+            self.current_collections = defaultdict(deque)
 
         '''
         MECHANISM:
-        Removes all of the marks made in the (current) oldest hour of the animated chart
+        Expires the arcs of the animated chart by time rather than by count (days needn't have as many segments as each other, e.g. when sampled adaptively): every segment begun by the given hour of the given day goes, as does any arc with nothing left of it.
+        Returns whether anything was expired.
         '''
-        def expire(self, parent, arc):
-            key = (parent, arc)
-            group = self.current_collections[key]
-            if group["collections"]:
-                oldest_collection = group["collections"][0]
-                if self.scroll.decay_line(oldest_collection):
-                    group["collections"].pop(0)
+        def expire(self, day, hour):
+            expired = False
+            for group in self.current_collections.values():
+                while group:
+                    oldest = group[0]
+                    collection, start, end, arc_day = oldest
+                    if arc_day > day:
+                        break
+
+                    # KNOWLEDGE: segment i starts at vertex i, and its chart hour is that vertex's x; an arc from an earlier day has gone altogether
+                    spent = end - 1 if arc_day < day else start + int(np.searchsorted(self.vertices[start:end - 1, 0], hour + 1))
+                    if spent == start:
+                        break
+
+                    expired = True
+                    if self.scroll.decay_line(collection, self.vertices[min(spent, end - 1) - 1:end]):
+                        group.popleft()
+                    else:
+                        oldest[1] = spent
+                        break
+            return expired
 
         '''
         MECHANISM:
-        Adds the animated marks to the PARCHMENT, remembering all the marks made in the given hour so they can later be expired.
-        '''
-        def extend(self, parent, arc, hour, segment, color, linewidth, zorder):
-            key = (parent, arc)
-            group = self.current_collections[key]
-            if hour == 0:
-                inscription, _ = self.scroll.add_lines([segment], [color], linewidth, zorder)
-                group["collections"].append(inscription)
+        Adds the animated marks to the PARCHMENT, remembering all the marks made for each day's arc so they can later be expired. The opening segment (the first of the vertices) of a day's arc starts a fresh collection; the rest extend it.
+        '''
+        def extend(self, parent, arc, day, opening, first, color, linewidth, zorder):
+            group = self.current_collections[(parent, arc)]
+            if opening:
+                inscription, _ = self.scroll.add_lines([self.vertices[first:first + 2]], [color], linewidth, zorder)
+                group.append([inscription, first, first + 2, day])
             else:
-                latest_collection = group["collections"][-1]
-                self.scroll.extend_line(latest_collection, segment, color, linewidth)
+                latest = group[-1]
+                latest[2] = first + 2
+                self.scroll.extend_line(latest[0], self.vertices[latest[1]:latest[2]], color, linewidth)
 
     '''
     BEHAVIOUR:
-    Executes the animation of the current (complete) plot.
+    Performs the animation of the current (complete) plot, an hour (a frame) at a time: each hour's steps are played out on the chart, then the performance yields for the frame to be put out; whoever is watching decides when (and whether) to put it out, and when to ask for the next.
+    Only the frames of the given turns of the day (see DayTracker.turns) are yielded, if we are asked for just those; the turns before them are still played through (without being drawn) since they leave the chart as the first of them finds it.
     '''
-    def animate(self, frame_out, day_tracker, bg_veil, animation_filter):
+    def perform(self, day_tracker, bg_veil, animation_filter, turns=None):
+        timeline = self.compile()
         # PROSE: Remember what was visible before the animation so we can restore that state later. Then turn all the veils of so we have a blank slate for the animation to begin.
-        current_arcs = self.ArcLimiter(self.scroll)
+        current_arcs = self.ArcLimiter(self.scroll, timeline.vertices)
+        # KNOWLEDGE: where we note what each step changes, so each frame need only redraw that much
+        palimpsest = self.scroll.palimpsest
+
+        # only animate that which was visible
+        animated = [animation_filter.is_animated(layer) for layer in timeline.layers]
 
         # animate by day...
+        turn = 0
         while day_tracker.more_days:
+            if turns is not None and turn >= turns.stop:
+                break
+            shown = turns is None or turn in turns
+
             # ... by hour...
             for hour in range(25):
-                steps = self.all_animation_steps[day_tracker.day][hour]
-                bg_update_needed = False
+                # remove any expired line segments / collections: those of the day that has dropped out of the day cap, up to this hour
+                if day_tracker.too_many_days and current_arcs.expire(day_tracker.day - day_tracker.day_cap, hour):
+                    palimpsest.smudge()
+
                 # ...by step...
-                for step in steps:
-                    # only animate that which was visible
-                    if not animation_filter.is_animated(step["parent"]):
+                for kind, layer, arc, band, first, opening, width, zorder, rgba in timeline.steps(day_tracker.day, hour):
+                    if not animated[layer]:
                         continue
-
-                    # remove any expired line segments / collections
-                    if day_tracker.too_many_days and step["type"] == "line":
-                        current_arcs.expire(step["parent"], step["arc"])
+                    parent = timeline.layers[layer]
 
                     # if we are currently unwinding the animation, just get on with it, no need to look for any steps that might want adding
                     if day_tracker.end_of_days:
@@ -279,41 +439,50 @@ class Inscriptions():
 
                     # otherwise perform the animated steps, which includes:
                     # - update title (specifically so the date range is accurate)
-                    if step["type"] == "title":
-                        self.scroll.retitle(step["title"])
+                    if kind == self.TITLE:
+                        self.scroll.retitle(timeline.texts[first])
+                        palimpsest.smudge()
 
                     # - update x-axis ticks, which change on daylight saving days
-                    elif step["type"] == "ticks":
-                        self.scroll.xaxis.ticklabel(step["label"], step["index"])
+                    elif kind == self.TICKS:
+                        if self.scroll.xaxis.ticklabel(timeline.texts[first], band):
+                            palimpsest.fade()
 
                     # - add the transit arcs for the hour
-                    elif step["type"] == "line":
-                        current_arcs.extend(step["parent"], step["arc"], hour, step["segment"],  step["color"], step["linewidth"], step["zorder"])
+                    elif kind == self.LINE:
+                        segment = timeline.vertices[first:first + 2]
+                        current_arcs.extend(parent, arc, day_tracker.day, opening, first, rgba, width, zorder)
+                        palimpsest.stroke(segment, rgba, width)
 
                     # - grow the day bands as the animation procedes. So on day 1 we see the daybands expand from nothing
-                    elif step["type"] == "dayband":
-                        self.scroll.set_block(bg_veil[step["band"]], step["extent"])
+                    elif kind == self.DAYBAND:
+                        self.scroll.set_block(bg_veil[band], timeline.vertices[first:first + 2])
+                        palimpsest.smudge()
 
                     # - shuffle the day bands on subsequent days
-                    elif step["type"] == "bandshift":
-                        self.scroll.shuffle_blocks(bg_veil, step["band"], step["extent"])
+                    elif kind == self.BANDSHIFT:
+                        self.scroll.shuffle_blocks(bg_veil, band, timeline.vertices[first:first + 2])
+                        palimpsest.smudge()
+
+                    # - or, for a woven background, reveal the day's row an hour at a time
+                    elif kind == self.DAYROW:
+                        bg_veil[0].reveal(day_tracker.day, band)
+                        palimpsest.smudge()
 
                 # At the end of each hour now...
                 # on the final day of the unwind, erase the background and the x-tick labels (since time is evapourating..!) on an hour-by-hour basis
                 if day_tracker.final_day:
                     self.scroll.decay_blocks(bg_veil, hour)
-                    self.scroll.xaxis.ticklabel("--:00", hour)
+                    palimpsest.smudge()
+                    if self.scroll.xaxis.ticklabel("--:00", hour):
+                        palimpsest.fade()
 
-                # display/record the animation of this hour
-                frame_out.capture()
+                # hand over the animation of this hour, to be displayed/recorded
+                if shown:
+                    yield
+                else:
+                    palimpsest.smudge()
 
             # at the end of day, step to the next day, if there is one
             day_tracker.step_day()
-
-    @staticmethod
-    def iter_anim_steps(animation_steps):
-        for day in range(len(animation_steps)):
-            for hour in sorted(animation_steps[day]):
-                for step in animation_steps[day][hour]:
-                    yield day, hour, step
-
+            turn += 1
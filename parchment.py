@@ -74,6 +74,8 @@ class ChartedElements:
             patch.set_xy(xy)
             patch.set_width(w)
             patch.set_height(h)
+        for image in ax.images:
+            image.restore()
 
         ax.title.set_text(self.title)
         ax.set_xticklabels(self.xticks)
@@ -113,6 +115,13 @@ class InnerChartElements():
         for inscription in inscriptions:
             inscription.set_visible(visible)
 
+    '''
+    KNOWLEDGE:
+    The lines of the grid, which live with the axes' x and y axis rather than on the axes themselves
+    '''
+    def gridlines(self):
+        return [line for axis in (self.ax.xaxis, self.ax.yaxis) for line in axis.get_gridlines()]
+
     '''
     MECHANISM:
     Establish the look of the grid (when it is visible) or else sets the grid invisaible
@@ -141,40 +150,41 @@ class InnerChartElements():
 
     '''
     MECHANISM:
-    Specifically for the animation, extends an arc's previous line collection with a new hour's segment
+    Adds an (empty) quire to the parchment, into which the lines of many transit arcs can be gathered; see Quire
     '''
-    @staticmethod
-    def extend_line(collection, extension, colour, linewidth):
-        latest_segments = collection.get_segments()
-        latest_colors = collection.get_colors()
-        latest_widths = collection.get_linewidths()
-
-        # Extend the last segment with new coordinate
-        last_segment = latest_segments[-1]
-        extended = np.vstack([last_segment, extension[1]])
-        latest_segments[-1] = extended
-
-        # Update colour and width for the extended segment
-        latest_colors[-1] = colour
-        latest_widths[-1] = linewidth
+    def add_quire(self, linewidths, zorder):
+        inscription = Quire(linewidths, zorder)
+        self.ax.add_collection(inscription)
+        return inscription
 
-        # Re-apply updated data
-        collection.set_segments(latest_segments)
-        collection.set_color(latest_colors)
-        collection.set_linewidths(latest_widths)
+    '''
+    MECHANISM:
+    Gathers the lines of a transit arc (its segments and their colours, as RGBA) into a quire, returning the leaf they are bound in (so they can later be discarded)
+    '''
+    @staticmethod
+    def gather_lines(quire, segments, colours):
+        return quire.gather(segments, colours)
 
     '''
     MECHANISM:
-    Shrinks a line collection from its earliest point, until it is sooo short it is no longer a collection of lines (whereupon it is removed completely)!
+    Specifically for the animation, extends an arc's line collection to the (longer) path given, in the colour of its newest segment.
+    The collection keeps the path as given, so a view onto a larger array of vertices costs nothing to hand over, however long the arc grows
     '''
     @staticmethod
-    def decay_line(collection):
-        segments = collection.get_segments()
+    def extend_line(collection, path, colour, linewidth):
+        collection.set_segments([path])
+        collection.set_color(colour)
+        collection.set_linewidth(linewidth)
 
+    '''
+    MECHANISM:
+    Shrinks a line collection's path from its earliest point, until it is sooo short it is no longer a collection of lines (whereupon it is removed completely)!
+    '''
+    @staticmethod
+    def decay_line(collection, path):
         # Shrink the lone path gradually
-        if len(segments[0]) > 2:
-            segments[0] = segments[0][1:]  # Remove earliest point
-            collection.set_segments(segments)
+        if len(path) > 2:
+            collection.set_segments([path[1:]])  # Remove earliest point
         else:
             # Once only two points remain, remove the whole collection
             collection.remove()
@@ -200,6 +210,16 @@ class InnerChartElements():
         return inscription, colour
 
 
+    '''
+    MECHANISM:
+    Adds a tapestry (see Tapestry) to the parchment, its daylight levels coloured as given (from true night up to full day)
+    '''
+    def add_tapestry(self, colour_defs, zorder):
+        colours = [self._resolve_rgba(colour_def) for colour_def in colour_defs]
+        tapestry = Tapestry(self.ax, colours, zorder)
+        self.ax.add_image(tapestry)
+        return tapestry
+
     '''
     SKILL:
     Updates the position and extent of a block on the parchment
@@ -229,11 +249,14 @@ class InnerChartElements():
 
     '''
     MECHANISM:
-    Shrinks background blocks from the left, specifically during the wind-down of an animation
+    Shrinks background blocks from the left, specifically during the wind-down of an animation; a woven background (see Tapestry) frays instead
     '''
     @staticmethod
     def decay_blocks(blocks, clip_at):
         for i in range(len(blocks)):
+            if isinstance(blocks[i], Tapestry):
+                blocks[i].fray(clip_at)
+                continue
             xy = blocks[i].get_xy()
             width = blocks[i].get_width()
             if int(xy[0]) == clip_at:
@@ -251,6 +274,620 @@ class InnerChartElements():
         else:
             return to_rgba(colour_def)  # Single colour string or RGB tuple
 
+'''
+AFFORDANCE:
+A quire is a gathering of folios, bound together. Here it gathers every day's transit arcs (of an inscription layer) into a single line collection, rather than each arc being a collection of its own; so however many days are charted the axes have only a handful of collections to draw, save and show or hide.
+Each arc gathered is bound in a leaf of the quire: its segments (as paths, and as an array), their colours and whether they are shown. Discarding a leaf merely stops it being shown; the quire is bound afresh (from those leaves still shown) when next it is drawn, and once it holds more discarded segments than shown ones those are cut out altogether.
+A condensed quire is drawn as a density image of its arcs instead, for when there are so many days charted that the arcs would only smear into one another anyway (and take ever longer to draw doing so); see condense.
+'''
+class Quire(LineCollection):
+    # KNOWLEDGE: a condensed quire bins its arcs over the whole chart, by 1 degree of altitude and 5 minutes of the day
+    EXTENT = (0, 24, -90, 90)
+    BINS = (180, 288)
+    # KNOWLEDGE: the arcs are binned a few thousand segments at a time, which keeps the samples taken along them from swamping memory
+    SHEAF = 4096
+
+    def __init__(self, linewidths, zorder):
+        super().__init__([], linewidths=linewidths, zorder=zorder)
+        self.paths = []
+        self.segments = np.zeros((0, 2, 2))
+        self.colours = np.zeros((0, 4))
+        self.shown = np.zeros(0, dtype=bool)
+
+        # KNOWLEDGE: where each leaf's segments lie amongst the paths
+        self.leaves = {}
+        self.leafage = 0
+        self.unbound = False
+
+        # KNOWLEDGE: the density image is only laid down (and, once laid, only condensed afresh after the leaves change) when the quire is drawn condensed
+        self.condensed = False
+        self.image = None
+        self.uncondensed = True
+
+    '''
+    MECHANISM:
+    Gathers the segments of an arc, coloured as given (an RGBA row for each), into a fresh leaf; making room for twice as many segments whenever we run out
+    '''
+    def gather(self, segments, colours):
+        start = len(self.paths)
+        # KNOWLEDGE: the segments come as an array of floats already, so there's nothing for a path to check or convert; matplotlib's own quick way of making them will do
+        self.paths.extend(Path._fast_from_codes_and_verts(segment, None) for segment in segments)
+        stop = len(self.paths)
+
+        if stop > len(self.shown):
+            self.segments = np.concatenate([self.segments[:start], np.zeros((stop * 2 - start, 2, 2))])
+            self.colours = np.concatenate([self.colours[:start], np.zeros((stop * 2 - start, 4))])
+            self.shown = np.concatenate([self.shown[:start], np.zeros(stop * 2 - start, dtype=bool)])
+        if stop > start:
+            self.segments[start:stop] = segments
+            self.colours[start:stop] = colours
+            self.shown[start:stop] = True
+
+        leaf = self.leafage
+        self.leafage += 1
+        self.leaves[leaf] = (start, stop)
+        self.unbound = True
+        self.uncondensed = True
+        self.stale = True
+        return leaf
+
+    '''
+    MECHANISM:
+    Discards the leaf's segments from the quire
+    '''
+    def discard(self, leaf):
+        start, stop = self.leaves.pop(leaf)
+        self.shown[start:stop] = False
+        self.unbound = True
+        self.uncondensed = True
+        self.stale = True
+
+    '''
+    MECHANISM:
+    Binds those segments still shown into the collection; first cutting out the discarded ones, if they have come to outnumber the rest
+    '''
+    def bind(self):
+        shown = self.shown[:len(self.paths)]
+        if len(self.paths) > 2 * np.count_nonzero(shown):
+            before = np.concatenate([[0], np.cumsum(shown)])
+            self.leaves = {leaf: (int(before[start]), int(before[stop])) for leaf, (start, stop) in self.leaves.items()}
+            self.paths = list(compress(self.paths, shown))
+            self.segments = self.segments[:len(shown)][shown]
+            self.colours = self.colours[:len(shown)][shown]
+            self.shown = np.ones(len(self.paths), dtype=bool)
+            shown = self.shown
+
+        self._paths = list(compress(self.paths, shown))
+        self.set_color(self.colours[:len(shown)][shown])
+        self.unbound = False
+
+    '''
+    MECHANISM:
+    Condenses the segments still shown into a density image (RGBA) over the whole chart. Each segment is sampled once for every bin it crosses, and each sample weighs its share of the segment's length (in bins) times the segment's alpha; so faint arcs (in bright moonlight, say) count for less.
+    A bin takes the weighted mean colour of the arcs crossing it, and an opacity that grows with (the square root of) their weight; reaching full opacity at the 99th percentile of the bins crossed, so a few crowded bins don't leave the rest of the image a ghost.
+    '''
+    def condense(self):
+        rows, columns = self.BINS
+        left, right, bottom, top = self.EXTENT
+        scale = np.array([columns / (right - left), rows / (top - bottom)])
+        origin = np.array([left, bottom])
+
+        count = len(self.paths)
+        weights = np.zeros((4, rows * columns))
+        for sheaf in range(0, count, self.SHEAF):
+            end = min(sheaf + self.SHEAF, count)
+            shown = self.shown[sheaf:end]
+            segments = (self.segments[sheaf:end][shown] - origin) * scale
+            colours = self.colours[sheaf:end][shown]
+            if len(segments) == 0:
+                continue
+            spans = segments[:, 1] - segments[:, 0]
+            samples = np.maximum(1, np.ceil(np.abs(spans).max(axis=1))).astype(int)
+            segment = np.repeat(np.arange(len(segments)), samples)
+            # KNOWLEDGE: each sample is taken at the middle of its stretch of the segment
+            along = (np.arange(len(segment)) - np.repeat(np.cumsum(samples) - samples, samples) + 0.5) / samples[segment]
+            points = segments[segment, 0] + spans[segment] * along[:, None]
+            column = np.clip(points[:, 0].astype(int), 0, columns - 1)
+            row = np.clip(points[:, 1].astype(int), 0, rows - 1)
+            weight = (np.hypot(spans[:, 0], spans[:, 1]) / samples * colours[:, 3])[segment]
+            bins = row * columns + column
+            weights[3] += np.bincount(bins, weights=weight, minlength=rows * columns)
+            for channel in range(3):
+                weights[channel] += np.bincount(bins, weights=weight * colours[segment, channel], minlength=rows * columns)
+
+        density = weights[3]
+        crossed = density > 0
+        image = np.zeros((rows * columns, 4))
+        if crossed.any():
+            image[crossed, :3] = (weights[:3, crossed] / density[crossed]).T
+            image[:, 3] = np.sqrt(np.clip(density / np.percentile(density[crossed], 99), 0, 1))
+
+        if self.image is None:
+            self.image = AxesImage(self.axes, interpolation='bilinear', origin='lower', extent=self.EXTENT)
+            self.image.set_figure(self.figure)
+            self.image.set_transform(self.axes.transData)
+            self.image.set_clip_path(self.axes.patch)
+        self.image.set_data(image.reshape(rows, columns, 4))
+        self.uncondensed = False
+
+    def draw(self, renderer):
+        if self.condensed:
+            if not self.get_visible():
+                return
+            if self.uncondensed:
+                self.condense()
+            self.image.draw(renderer)
+            self.stale = False
+            return
+        if self.unbound:
+            self.bind()
+        super().draw(renderer)
+
+'''
+AFFORDANCE:
+A tapestry is woven a row at a time. Here each row is a day of the chart, and each column a minute of it (noon to noon); every stitch being the daylight level of that minute (true night, astronomical, nautical or civil twilight, or full day) whose colour is looked up as the tapestry is drawn. So however many days are charted, all of their day bands are a single image, rather than a set of blocks for each day (or, as the blocks have it, just those of the last day).
+The rows run down the plot area, from the first day at the top to the last at the bottom, filling it whatever the altitude range; so the tapestry gives the seasons' changing nights as a backdrop to the arcs.
+Only the stitches shown are drawn, so an animation can unravel the tapestry and then reveal it again, an hour of a day at a time.
+'''
+class Tapestry(AxesImage):
+    # KNOWLEDGE: a stitch for every minute of the day
+    STITCHES = 24 * 60
+
+    def __init__(self, ax, colours, zorder):
+        super().__init__(ax, cmap=ListedColormap(colours), norm=NoNorm(), interpolation='nearest', origin='upper', extent=(0, 24, 0, 1), zorder=zorder)
+        # KNOWLEDGE: hours across (as data), but days down the whole height of the axes
+        self.set_transform(ax.get_xaxis_transform())
+        self.warp(1)
+
+    '''
+    MECHANISM:
+    Sets up the loom for the given number of days, none of them yet woven
+    '''
+    def warp(self, days):
+        self.weft = np.zeros((days, self.STITCHES), dtype=np.uint8)
+        self.woven = np.zeros(days, dtype=bool)
+        self.shown = np.zeros((days, self.STITCHES), dtype=bool)
+        self.unbound = True
+        self.stale = True
+
+    '''
+    MECHANISM:
+    Weaves (and shows) the row of a single day from its bands: where each ends (hours from noon, the bands running on from one another) and its daylight level
+    '''
+    def weave(self, row, ends, levels):
+        minutes = (np.arange(self.STITCHES) + 0.5) / 60
+        bands = np.minimum(np.searchsorted(ends, minutes, side='right'), len(levels) - 1)
+        self.weft[row] = np.asarray(levels)[bands]
+        self.woven[row] = True
+        self.shown[row] = True
+        self.unbound = True
+        self.stale = True
+
+    '''
+    MECHANISM:
+    Specifically for the animation: hides every stitch, reveals an hour of a day's row, or hides an hour of every row (as the animation winds down)
+    '''
+    def unravel(self):
+        self.shown[:] = False
+        self.unbound = True
+        self.stale = True
+
+    def reveal(self, row, hour):
+        self.shown[row, hour * 60:(hour + 1) * 60] = self.woven[row]
+        self.unbound = True
+        self.stale = True
+
+    def fray(self, hour):
+        self.shown[:, hour * 60:(hour + 1) * 60] = False
+        self.unbound = True
+        self.stale = True
+
+    '''
+    MECHANISM:
+    Shows every row woven, as the tapestry was before any animation
+    '''
+    def restore(self):
+        self.shown[:] = self.woven[:, None]
+        self.unbound = True
+        self.stale = True
+
+    def draw(self, renderer):
+        if self.unbound:
+            self.set_data(np.ma.masked_array(self.weft, mask=~self.shown))
+            self.unbound = False
+        super().draw(renderer)
+
+'''
+AFFORDANCE:
+A palimpsest is a parchment that has been scraped clean and written over, while what lies beneath still shows through. That's just how we present an (on-screen) animation: the parts of the chart that don't change from frame to frame (the axes, their labels, the y ticks) are drawn the once and held as a backdrop, and each frame only the marks are laid over it (the day bands, the grid, the arcs, the guides, the spines and the title), rather than drawing the whole figure, text and all, every time.
+Better still, a frame that only extends the arcs (which is most of them) needn't even scrape back to the backdrop: its new strokes are simply drawn over the last frame. Anything else (a band shifting, an arc expiring, the title changing) smudges the frame, whereupon the marks are laid over the backdrop afresh. Should the backdrop itself change (an x tick label on a daylight saving day, or the figure being redrawn or resized behind our back) it has faded, and is held again.
+'''
+class Palimpsest:
+    def __init__(self, canvas, ax):
+        self.canvas = canvas
+        self.ax = ax
+
+        # KNOWLEDGE: the backdrop (and the size of the canvas it was held for), or None when we aren't animating
+        self.backdrop = None
+        self.held_size = None
+        self.faded = False
+        self.listening = None
+
+        # KNOWLEDGE: the marks we have set apart from the backdrop (so we can return them when done), the strokes made since the last frame, and whether anything else has changed
+        self.marks = set()
+        self.strokes = []
+        self.smudged = False
+
+    '''
+    KNOWLEDGE:
+    The marks laid over the backdrop, in the order they are drawn (as the figure would): everything in the plot area that can change during an animation, plus the spines and the title.
+    The grid is drawn within its axis (which otherwise stays on the backdrop), so its lines are picked out separately, at the axis' own depth; i.e. above the day bands and below the arcs.
+    '''
+    def _marks(self):
+        ax = self.ax
+        marks = [(mark.get_zorder(), mark) for mark in [*ax.patches, *ax.images, *ax.collections, *ax.lines, *ax.spines.values(), ax.title]]
+        marks += [(axis.get_zorder(), line) for axis in (ax.xaxis, ax.yaxis) for line in axis.get_gridlines()]
+        return [mark for _, mark in sorted(marks, key=lambda depth_mark: depth_mark[0])]
+
+    def _gridlines(self):
+        return [line for axis in (self.ax.xaxis, self.ax.yaxis) for line in axis.get_gridlines()]
+
+    '''
+    MECHANISM:
+    Sets apart (as 'animated', so matplotlib leaves them off the backdrop) any marks that aren't already; e.g. the arcs added since the last frame
+    '''
+    def _set_apart(self, marks):
+        gridlines = set(self._gridlines())
+        for mark in marks:
+            if mark not in self.marks and mark not in gridlines:
+                mark.set_animated(True)
+                self.marks.add(mark)
+
+    '''
+    MECHANISM:
+    Holds the backdrop: the figure drawn without any of its marks (which are set apart as 'animated', so matplotlib leaves them out; the grid lines are hidden for the moment since their axis is drawn regardless)
+    '''
+    def hold(self):
+        self._set_apart(self._marks())
+
+        gridlines = self._gridlines()
+        shown = [line.get_visible() for line in gridlines]
+        for line in gridlines:
+            line.set_visible(False)
+        self.canvas.draw()
+        for line, visible in zip(gridlines, shown):
+            line.set_visible(visible)
+
+        self.backdrop = self.canvas.copy_from_bbox(self.canvas.figure.bbox)
+        self.held_size = self.canvas.get_width_height()
+        self.faded = False
+        self.smudged = True
+
+        # KNOWLEDGE: any other drawing of the figure (e.g. a change of altitude range mid-animation) leaves our backdrop out of date
+        if self.listening is None:
+            self.listening = self.canvas.mpl_connect('draw_event', self._fade)
+
+    def _fade(self, event):
+        self.faded = True
+
+    '''
+    MECHANISM:
+    Notes the changes made to the chart since the last frame: a stroke extending an arc (drawn straight over the last frame), a smudge (the marks are laid afresh), or a change to the backdrop itself.
+    None of which matters unless we are holding a backdrop.
+    '''
+    def stroke(self, segment, colour, linewidth):
+        if self.backdrop is not None and not self.smudged:
+            self.strokes.append((segment, colour, linewidth))
+
+    def smudge(self):
+        self.smudged = True
+        self.strokes = []
+
+    def fade(self):
+        self.faded = True
+
+    '''
+    BEHAVIOUR:
+    Reveals the next frame, by doing as little as the changes since the last frame allow, then shows it (see above)
+    '''
+    def reveal(self):
+        if self.backdrop is None:
+            return
+
+        if self.faded or self.canvas.get_width_height() != self.held_size:
+            self.hold()
+
+        if self.smudged:
+            self.canvas.restore_region(self.backdrop)
+            marks = self._marks()
+            self._set_apart(marks)
+            for mark in marks:
+                self.ax.draw_artist(mark)
+        elif self.strokes:
+            segments, colours, linewidths = zip(*self.strokes)
+            strokes = LineCollection(segments, colors=colours, linewidths=linewidths, transform=self.ax.transData)
+            strokes.set_figure(self.canvas.figure)
+            strokes.set_clip_path(self.ax.patch)
+            self.ax.draw_artist(strokes)
+
+        self.strokes = []
+        self.smudged = False
+        self.canvas.blit(self.canvas.figure.bbox)
+        QApplication.processEvents()
+
+    '''
+    MECHANISM:
+    Lets go of the backdrop, returning the marks to the figure proper
+    '''
+    def release(self):
+        if self.listening is not None:
+            self.canvas.mpl_disconnect(self.listening)
+            self.listening = None
+        for mark in self.marks:
+            mark.set_animated(False)
+        self.marks = set()
+        self.backdrop = None
+        self.strokes = []
+
+'''
+AFFORDANCE:
+Laminae are the thin layers a thing is pressed together from. Here they are the layers of the chart (the day bands, the grid, the arcs, the threshold), each pressed into a raster of its own (of the plot area, at the size of the canvas) along with a backdrop of everything else (the axes and their labels); all drawn the once.
+So showing or hiding a layer needn't draw the whole figure again: the backdrop is laid down, the laminae of the layers now shown are laid over it (alpha composited, in the order the figure would draw them), then the title and spines are drawn on top (the title having likely changed along with the layers shown).
+The laminae are spoiled by any other drawing of the figure, since that is how every change to the chart (new arcs, an altitude range, a threshold, a resized canvas) is seen; they are pressed afresh when next needed.
+A layer is anything with a visible state and the marks it shows or hides (see Inscriptions.Inscribe)
+'''
+class Laminae:
+    def __init__(self, canvas, ax):
+        self.canvas = canvas
+        self.ax = ax
+        self.layers = []
+
+        # KNOWLEDGE: the backdrop (the whole figure) and, for each layer with marks, its lamina (the plot area only, where all of its marks are clipped), or None until pressed
+        self.backdrop = None
+        self.laminae = []
+        self.plot_area = None
+
+        self.pressing = False
+        self.canvas.mpl_connect('draw_event', self._spoil)
+
+    def _spoil(self, event):
+        if not self.pressing:
+            self.backdrop = None
+
+    '''
+    KNOWLEDGE:
+    The marks that are drawn over every layer, and so can't be pressed into the backdrop
+    '''
+    def _overlay(self):
+        return [*self.ax.spines.values(), self.ax.title]
+
+    '''
+    KNOWLEDGE:
+    Where the figure draws a mark: by its depth (zorder), then in the order the axes keeps its children; grid lines are drawn with (and at the depth of) their axis
+    '''
+    def _depth(self, mark, order):
+        for axis in (self.ax.xaxis, self.ax.yaxis):
+            if mark in axis.get_gridlines():
+                return axis.get_zorder(), order.get(axis, 0)
+        return mark.get_zorder(), order.get(mark, 0)
+
+    '''
+    KNOWLEDGE:
+    The plot area, as rows and columns of the canvas' buffer (whose rows run top down), with a pixel or so to spare for anti-aliasing
+    '''
+    def _plot_area(self, buffer):
+        height, width = buffer.shape[:2]
+        x0, y0, x1, y1 = self.ax.bbox.extents
+        return (
+            slice(max(0, height - math.ceil(y1) - 1), min(height, height - math.floor(y0) + 1)),
+            slice(max(0, math.floor(x0) - 1), min(width, math.ceil(x1) + 1))
+        )
+
+    '''
+    MECHANISM:
+    Presses the backdrop (the figure drawn without any layer's marks, nor the overlay) and then each layer's lamina: its marks alone, shown or not, drawn over a clear canvas.
+    A lamina is kept as its pixels, which of them are opaque (and so simply replace what lies beneath) and, for the few that are neither opaque nor clear (the edges of lines, the grid, translucent arcs), their colours already weighted by their alpha.
+    Matplotlib places the title (above whatever is at the top of the axes) as it draws the figure; with the overlay hidden it loses its bearings, so the title is kept where it was.
+    '''
+    def press(self):
+        order = {child: i for i, child in enumerate(self.ax.get_children())}
+        layers = []
+        for layer in self.layers:
+            marks = sorted(layer.marks(), key=lambda mark: self._depth(mark, order))
+            if marks:
+                layers.append((self._depth(marks[0], order), layer, marks))
+        layers.sort(key=lambda depth_layer: depth_layer[0])
+
+        marks = self._overlay() + [mark for _, _, layer_marks in layers for mark in layer_marks]
+        shown = [mark.get_visible() for mark in marks]
+        title_place = self.ax.title.get_position()
+
+        self.pressing = True
+        for mark in marks:
+            mark.set_visible(False)
+        self.canvas.draw()
+
+        renderer = self.canvas.get_renderer()
+        buffer = np.asarray(renderer.buffer_rgba())
+        self.backdrop = buffer.copy()
+        self.plot_area = self._plot_area(buffer)
+
+        self.laminae = []
+        for _, layer, layer_marks in layers:
+            renderer.clear()
+            for mark in layer_marks:
+                mark.set_visible(True)
+                mark.draw(renderer)
+                mark.set_visible(False)
+
+            lamina = buffer[self.plot_area].copy()
+            alpha = lamina[..., 3]
+            translucent = np.flatnonzero((alpha > 0) & (alpha < 255))
+            blend = lamina.reshape(-1, 4)[translucent].astype(np.uint16)
+            self.laminae.append((
+                layer,
+                lamina.view(np.uint32)[..., 0],
+                alpha == 255,
+                translucent,
+                blend[:, :3] * blend[:, 3:],
+                255 - blend[:, 3:]
+            ))
+
+        for mark, visible in zip(marks, shown):
+            mark.set_visible(visible)
+        self.ax.title.set_position(title_place)
+        self.pressing = False
+
+    '''
+    BEHAVIOUR:
+    Shows the chart with its layers as they are now shown or hidden, by laying the laminae of those shown over the backdrop (pressing them first, if they have been spoiled or the canvas has changed size)
+    '''
+    def reveal(self):
+        buffer = np.asarray(self.canvas.get_renderer().buffer_rgba())
+        if self.backdrop is None or self.backdrop.shape != buffer.shape:
+            self.press()
+            buffer = np.asarray(self.canvas.get_renderer().buffer_rgba())
+
+        # KNOWLEDGE: opaque pixels are copied whole, as 32 bit words (which is quicker than byte by byte)
+        plot = self.backdrop[self.plot_area].copy()
+        pixels = plot.reshape(-1, 4)
+        for layer, colours, opaque, translucent, weighted, transparency in self.laminae:
+            if layer.visible:
+                np.copyto(plot.view(np.uint32)[..., 0], colours, where=opaque)
+                pixels[translucent, :3] = (weighted + pixels[translucent, :3] * transparency + 127) // 255
+
+        buffer[:] = self.backdrop
+        buffer[self.plot_area] = plot
+        for mark in self._overlay():
+            self.ax.draw_artist(mark)
+        self.canvas.blit(self.canvas.figure.bbox)
+
+'''
+AFFORDANCE:
+A reel takes the frames of an animation, just as they were drawn on the parchment (i.e. the raw RGBA of Agg's buffer; nothing is re-drawn or encoded as an image along the way) and feeds them to FFMPEG as raw video, from a thread of its own. So drawing the next frame needn't wait on the last one being written.
+Agg draws every frame into the same buffer, so each frame is copied (just the once) into one of a few spare frames, which go round between us and the writing thread. If they are all still waiting to be written we wait for one to come back; so a slow encoder holds back the drawing rather than the frames piling up in memory.
+The encoding is ours to choose: the codec, its quality (crf) and speed (preset), and the pixel format written; crf and preset can be left out (None) for codecs that don't take them.
+'''
+class Reel:
+    def __init__(self, canvas, outfile, fps, codec="libx264", crf=23, preset="medium", pix_fmt="yuv420p", depth=8):
+        self.canvas = canvas
+        self.outfile = outfile
+        self.fps = fps
+        self.encoding = {"codec": codec, "crf": crf, "preset": preset, "pix_fmt": pix_fmt}
+        self.depth = depth
+
+        # KNOWLEDGE: FFMPEG and the writing thread are only started with the first frame, once we know its size
+        self.ffmpeg = None
+        self.writing = None
+        self.shape = None
+        self.failure = None
+
+        # KNOWLEDGE: frames waiting to be written, and the spare frames waiting to be drawn into
+        self.frames = queue.Queue()
+        self.spares = queue.Queue()
+
+    '''
+    KNOWLEDGE:
+    How FFMPEG is asked to turn raw RGBA frames (of the given size) into the video file. The frame is padded to even dimensions, since most pixel formats insist on it.
+    '''
+    def _command(self, width, height):
+        encoding = self.encoding
+        command = [
+            rcParams["animation.ffmpeg_path"], "-y", "-loglevel", "error",
+            "-f", "rawvideo", "-pix_fmt", "rgba", "-s", f"{width}x{height}", "-r", str(self.fps), "-i", "-",
+            "-vf", "pad=ceil(iw/2)*2:ceil(ih/2)*2",
+            "-c:v", encoding["codec"], "-pix_fmt", encoding["pix_fmt"]
+        ]
+        if encoding["crf"] is not None:
+            command += ["-crf", str(encoding["crf"])]
+        if encoding["preset"] is not None:
+            command += ["-preset", encoding["preset"]]
+        return command + [self.outfile]
+
+    '''
+    MECHANISM:
+    Starts FFMPEG and the thread that writes to it, with a set of spare frames of the given size
+    '''
+    def _start(self, shape):
+        self.shape = shape
+        height, width = shape[:2]
+        self.ffmpeg = subprocess.Popen(self._command(width, height), stdin=subprocess.PIPE, stderr=subprocess.PIPE)
+        for _ in range(self.depth):
+            self.spares.put(bytearray(height * width * 4))
+        self.writing = threading.Thread(target=self._write, daemon=True)
+        self.writing.start()
+
+    '''
+    MECHANISM:
+    Writes each frame to FFMPEG as it comes, handing it back as a spare once written. Should FFMPEG fall over we carry on handing the frames back (so nobody is left waiting on a spare), and the failure is raised with the next frame.
+    '''
+    def _write(self):
+        while True:
+            frame = self.frames.get()
+            if frame is None:
+                return
+            if self.failure is None:
+                try:
+                    self.ffmpeg.stdin.write(frame)
+                except OSError as failure:
+                    self.failure = failure
+            self.spares.put(frame)
+
+    '''
+    BEHAVIOUR:
+    Takes the frame currently on the parchment (as it was last drawn) and sends it on its way to the video file
+    '''
+    def grab_frame(self):
+        drawn = self.canvas.buffer_rgba()
+        if self.ffmpeg is None:
+            self._start(drawn.shape)
+        if drawn.shape != self.shape:
+            raise ValueError(f"OOPS:: the parchment changed size mid-recording ({self.shape} to {drawn.shape})")
+        if self.failure is not None:
+            raise RuntimeError(f"OOPS:: FFMPEG gave up on {self.outfile}: {self._complaint()}") from self.failure
+
+        frame = self.spares.get()
+        frame[:] = drawn
+        self.frames.put(frame)
+
+    '''
+    MECHANISM:
+    Splices videos (recorded as segments, all encoded alike) end to end into a single video file; losslessly, since FFMPEG's concat demuxer simply copies the frames across
+    '''
+    @staticmethod
+    def splice(segments, outfile):
+        listing = os.path.join(os.path.dirname(os.path.abspath(segments[0])), "segments.txt")
+        with open(listing, "w") as segment_list:
+            for segment in segments:
+                segment_list.write(f"file '{os.path.abspath(segment)}'\n")
+        command = [
+            rcParams["animation.ffmpeg_path"], "-y", "-loglevel", "error",
+            "-f", "concat", "-safe", "0", "-i", listing, "-c", "copy", outfile
+        ]
+        spliced = subprocess.run(command, stderr=subprocess.PIPE)
+        if spliced.returncode != 0:
+            raise RuntimeError(f"OOPS:: FFMPEG couldn't splice {outfile}: {spliced.stderr.decode(errors='replace').strip()}")
+
+    def _complaint(self):
+        self.ffmpeg.wait()
+        return self.ffmpeg.stderr.read().decode(errors="replace").strip()
+
+    '''
+    MECHANISM:
+    Waits for every frame to be written, then closes the video file
+    '''
+    def finish(self):
+        if self.ffmpeg is None:
+            return
+        self.frames.put(None)
+        self.writing.join()
+        try:
+            self.ffmpeg.stdin.close()
+        except OSError:
+            pass
+        if self.ffmpeg.wait() != 0 or self.failure is not None:
+            raise RuntimeError(f"OOPS:: FFMPEG gave up on {self.outfile}: {self._complaint()}")
+
 '''
 AFFORDANCE:
 The parchment sets the overall look and feel of a chart, it orchestrates the ChartedElements and provides for video records. It is the visualisation of the chart.
@@ -322,9 +959,10 @@ class Parchment(InnerChartElements):
 
         def ticklabel(self, label, index):
             if self.labels[index] == label:
-                return
+                return False
             self.labels[index] = label
             self.ticklabels(self.labels)
+            return True
 
         def blankticks(self):
             self.labels = ['--:00' for _ in self.xticks]
@@ -366,6 +1004,9 @@ class Parchment(InnerChartElements):
         self.xaxis = self.XAxis(self.canvas, self.ax, "Hour (Local Time)", font_family, text_colour)
         self.yaxis = self.YAxis(self.canvas, self.ax, -30.0, 90.0, "Altitude (°)", font_family, text_colour)
 
+        self.palimpsest = Palimpsest(self.canvas, self.ax)
+        self.laminae = Laminae(self.canvas, self.ax)
+
     '''
     SKILL:
     Renders a new title for the chart
@@ -376,16 +1017,15 @@ class Parchment(InnerChartElements):
     '''
     MECHANISM:
     Saves the format and content of the current parchment, before clearing it for fresh duty.
-    Changes the parchment format if we are writing a video file (to HD geometry)
+    Changes the parchment format if we are writing a video file (to HD geometry), providing the reel that writes it (encoded as asked, see Reel)
     '''
-    def fresh_parchment(self, outfile=None, fps=None):
+    def fresh_parchment(self, outfile=None, fps=None, encoding=None):
         self.original_chart.save_geometry(self.canvas)
 
         writer = None
         if fps is not None:
             self.canvas.resize(int(self.w_inches * self.dpi), int(self.h_inches * self.dpi))
-            writer = animation.FFMpegWriter(fps=fps)
-            writer.setup(self.canvas.figure, outfile, dpi=self.dpi)
+            writer = Reel(self.canvas, outfile, fps, **(encoding or {}))
 
         self.canvas.draw()
 
@@ -414,6 +1054,9 @@ class Parchment(InnerChartElements):
             patch.set_width(0)
             patch.set_xy([0, -90.0])
 
+        for image in self.ax.images:
+            image.unravel()
+
     '''
     MECHANISM:
     Signs-off the current parchment (closing the video file if we had it open) before clearing and restoring whatever went before.
@@ -429,6 +1072,30 @@ class Parchment(InnerChartElements):
         self.original_chart.restore_geometry(self.canvas)
         self.original_chart.restore_original_ax(self.ax)
 
+    '''
+    SKILL:
+    Asks for everything to be rendered when the GUI next has a moment; many such requests in quick succession only render the once.
+    '''
+    def refresh(self):
+        self.canvas.draw_idle()
+
+    '''
+    SKILL:
+    Tells the parchment which layers the chart is made of, so it can press them into laminae (see Laminae)
+    '''
+    def laminate(self, layers):
+        self.laminae.layers = list(layers)
+
+    '''
+    SKILL:
+    Shows the chart anew after its layers have been shown or hidden: by laying their laminae together, if we have been told what the layers are, otherwise by drawing everything.
+    '''
+    def recompose(self):
+        if self.laminae.layers:
+            self.laminae.reveal()
+        else:
+            self.redraw()
+
     '''
     SKILL:
     Ensures everything actually gets rendered.
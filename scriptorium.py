@@ -0,0 +1,482 @@
+from continuum import *
+'''
+THROUGHLINE:
+The scriptorium is where charts are copied out with nobody watching: no window, no buttons, no one to click them. We name what we want on the command line and the chart (or its animation) is written straight to file; which is just what we need to produce the nightly planning charts on a server.
+
+Nothing here is new: Idmon still does the divining and Astraeus the drawing, onto the very same parchment. The only difference is that Qt is asked to keep its widgets offscreen (so no display is needed) and its event loop is never run.
+
+Charts can be commissioned one at a time, or by the batch from a manifest; whereupon the armarius shares the work out among as many scribes as we have cores, making sure the heavens are only divined the once for any site and date, however many charts want them.
+'''
+
+from aeonforge import Kairos
+from astraeus import Astraeus
+from parchment import Reel
+from transits import Idmon, Tiphys
+
+'''
+FIGURATION:
+The scribe works alone in the scriptorium, with his own Astraeus to draw the charts; and his own Idmon to consult, unless he is simply copying out visions that have been divined for him.
+'''
+class Scribe:
+    def __init__(self, idmon=None):
+        self.idmon = idmon
+        self.astraeus = Astraeus()
+
+        # KNOWLEDGE: what was last transcribed (and how it was presented), so that other scribes can draw it again
+        self.transcript = None
+
+    '''
+    BEHAVIOUR:
+    Divines and draws the chart for a whole day range, just as The Observatory would have presented it (see transcribe for how it is presented)
+    '''
+    def inscribe(self, vantage, date, days, destinations, cadence=60, adaptive=False, **presentation):
+        prophecies = self.idmon.divine_days(vantage, date, days, destinations, cadence=cadence, adaptive=adaptive)
+        self.transcribe(date, days, destinations, prophecies, **presentation)
+
+    '''
+    MECHANISM:
+    Draws the chart for a vision that has already been divined (for just the given destinations)
+    '''
+    def inscribe_vision(self, vision, destinations, **presentation):
+        prophecies = ((day, vision.day(day)) for day in range(len(vision)))
+        self.transcribe(vision.dates[0], len(vision), destinations, prophecies, **presentation)
+
+    '''
+    BEHAVIOUR:
+    Draws the chart, day by day, from the prophecies given; with any layers shown or hidden (by name, see ArtBoard.layers), the altitude range, the threshold, the number of days beyond which arcs are shown as density images and whether every day's bands are woven into the background as asked.
+    '''
+    def transcribe(self, date, days, destinations, prophecies, layers=None, altitudes=None, threshold=None, density_days=None, twilight_raster=None):
+        prophecies = list(prophecies)
+        self.transcript = (date, days, destinations, prophecies, {"layers": layers, "altitudes": altitudes, "threshold": threshold, "density_days": density_days, "twilight_raster": twilight_raster})
+
+        artboard = self.astraeus.artboard
+        if altitudes is not None:
+            self.astraeus.scroll.yaxis.update_yrange(*altitudes)
+        if threshold is not None:
+            artboard.threshold.update_value(threshold)
+        if density_days is not None:
+            artboard.density_days = density_days
+        if twilight_raster is not None:
+            artboard.twilight_raster = twilight_raster
+
+        self.astraeus.commence_presentation(Tiphys.designation(destinations), date, days)
+        for day, (moon_arc, illumination, target_arcs, twilight) in prophecies:
+            labels = Kairos.hour_labels(date + timedelta(days=day))
+            self.astraeus.draw_day(day, labels, target_arcs, moon_arc, illumination, twilight)
+
+        artboard.set_layers(layers or {})
+        self.astraeus.complete_presentation()
+
+    '''
+    MECHANISM:
+    Writes the chart to an image file (the format follows the file's suffix, e.g. PNG, unless it is given; as it must be when writing to memory)
+    '''
+    def save_chart(self, outfile, format=None):
+        self.astraeus.scroll.canvas.figure.savefig(outfile, format=format)
+
+    '''
+    MECHANISM:
+    Records the animation of the chart to a video file, showing at most day_cap days of arcs at a time; encoded as asked (see Reel). Given more than one scribe, the animation is recorded in segments, all at once (see record_in_segments).
+    '''
+    def save_animation(self, outfile, day_cap=None, encoding=None, scribes=None):
+        if scribes and scribes > 1:
+            self.record_in_segments(outfile, day_cap, encoding, scribes)
+        else:
+            self.astraeus.artboard.record_animation(outfile, day_cap, encoding)
+
+    '''
+    BEHAVIOUR:
+    Records the animation in segments, a contiguous run of its turns of the day each, with each segment recorded by a scribe in a process of his own; then splices them together.
+    Each of those scribes transcribes the chart again for himself and plays the animation through (without drawing it) up to where his segment starts, which leaves his chart just as it would be at that point; so the segments meet seamlessly.
+    '''
+    def record_in_segments(self, outfile, day_cap, encoding, scribes):
+        day_cap, last_turn = self.astraeus.artboard.animation_turns(day_cap)
+        length = math.ceil(last_turn / scribes)
+        segments = [range(start, min(start + length, last_turn)) for start in range(0, last_turn, length)]
+
+        folder = tempfile.mkdtemp(prefix=".segments-", dir=os.path.dirname(os.path.abspath(outfile)))
+        try:
+            segment_files = [os.path.join(folder, f"{number:04d}.mp4") for number in range(len(segments))]
+            with ProcessPoolExecutor(max_workers=len(segments), mp_context=multiprocessing.get_context('spawn')) as scriptorium:
+                recordings = [
+                    scriptorium.submit(_record_segment, self.transcript, segment_file, day_cap, encoding, turns)
+                    for segment_file, turns in zip(segment_files, segments)
+                ]
+                for recording in recordings:
+                    recording.result()
+            Reel.splice(segment_files, outfile)
+        finally:
+            shutil.rmtree(folder, ignore_errors=True)
+
+    '''
+    MECHANISM:
+    Writes the chart out as whichever the file asks for: an animation for .mp4, otherwise an image
+    '''
+    def save(self, outfile, day_cap=None, encoding=None, scribes=None):
+        if outfile.lower().endswith(".mp4"):
+            self.save_animation(outfile, day_cap, encoding, scribes)
+        else:
+            self.save_chart(outfile)
+
+'''
+MECHANISM:
+Readies a process for the scriptorium: Qt is kept offscreen (we never run its event loop, but Astraeus's widgets need an application to belong to)
+'''
+def open_scriptorium():
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    return QApplication.instance() or QApplication(sys.argv[:1])
+
+# --- Armarius: Keeper of the Scriptorium ---
+'''
+FIGURATION:
+The armarius kept the books of a monastery, and handed out the copying work to the scribes in its scriptorium.
+Ours takes a manifest of commissions (charts for many sites, targets and date ranges) and sees them all done, as quickly as he can:
+- commissions from the same site (at the same sampling) whose date ranges overlap, or meet, are gathered into a single span; and each span is divined just the once, for every destination any of its commissions asks for. So the moon and the twilight are worked out once per site and date, however many charts need them.
+- the spans are divined, and the charts then drawn, across a pool of scribes (one process per core, each consulting an Idmon of its own that loads the almanac just the once). Each chart is drawn as soon as its span is known, from its own portion of the span's vision.
+- he notes how long every commission took (its share of the divining and its own drawing) in a report, written alongside the charts.
+'''
+class Armarius:
+    def __init__(self, manifest_path, workers=None):
+        self.manifest_path = manifest_path
+        manifest = self.read_manifest(manifest_path)
+        self.home = os.path.dirname(os.path.abspath(manifest_path))
+
+        # KNOWLEDGE: how many scribes work at once, and whether their Idmons only glance at the fixed stars
+        self.workers = workers or manifest.get("workers") or os.cpu_count()
+        self.fast_stars = manifest.get("fast_stars", False)
+
+        # KNOWLEDGE: where the timing report is written
+        self.report_path = self._placed(manifest.get("report", os.path.splitext(os.path.basename(manifest_path))[0] + "-report.json"))
+
+        defaults = manifest.get("defaults", {})
+        sites = manifest.get("sites", {})
+        self.commissions = [self._commission(number, {**defaults, **job}, sites) for number, job in enumerate(manifest["jobs"])]
+
+    '''
+    MECHANISM:
+    Reads a manifest of commissions, as TOML or JSON (by the file's suffix)
+    '''
+    @staticmethod
+    def read_manifest(manifest_path):
+        if manifest_path.lower().endswith(".toml"):
+            with open(manifest_path, "rb") as manifest:
+                return tomllib.load(manifest)
+        with open(manifest_path) as manifest:
+            return json.load(manifest)
+
+    '''
+    MECHANISM:
+    Places a file named in the manifest relative to the manifest itself
+    '''
+    def _placed(self, path):
+        return os.path.join(self.home, os.path.expanduser(path))
+
+    '''
+    KNOWLEDGE:
+    A single commission, in full: what is to be charted, from where, and how it is to be presented. A site may be given by name (from the manifest's sites) or by lat and lon.
+    '''
+    def _commission(self, number, job, sites):
+        site = sites[job["site"]] if "site" in job else job
+        targets = job.get("targets", ["Planets"])
+        if isinstance(targets, str):
+            targets = [targets]
+        unknown = [target for target in targets if target not in Tiphys.targets]
+        if unknown:
+            raise ValueError(f"OOPS:: {job.get('name', f'job-{number}')} asks for {', '.join(unknown)}, which we don't know how to look at")
+        try:
+            cadence = Kairos.true_cadence(job.get("resolution", 60))
+        except ValueError:
+            raise ValueError(f"OOPS:: {job.get('name', f'job-{number}')} asks for a resolution of {job.get('resolution')} minutes, which doesn't divide the hour") from None
+
+        return {
+            "name": job.get("name", f"job-{number}"),
+            "vantage": {"latitude": float(site["lat"]), "longitude": float(site["lon"])},
+            "date": date.fromisoformat(job["date"]) if "date" in job else date.today(),
+            "days": int(job.get("days", 7)),
+            "targets": targets,
+            "cadence": cadence,
+            "adaptive": bool(job.get("adaptive", False)),
+            "out": self._placed(job["out"]),
+            "layers": {name: False for name in job.get("hide", [])},
+            "altitudes": job.get("altitudes"),
+            "threshold": job.get("threshold"),
+            "density_days": job.get("density_days"),
+            "twilight_raster": bool(job.get("twilight_raster", False)),
+            "day_cap": job.get("day_cap"),
+            "encoding": self.encoding(job)
+        }
+
+    '''
+    KNOWLEDGE:
+    How an animation is to be encoded (see Reel), from whichever of codec, crf, preset and pix_fmt are given; e.g. by a job in the manifest, or on the command line
+    '''
+    @staticmethod
+    def encoding(asked):
+        return {name: asked[name] for name in ("codec", "crf", "preset", "pix_fmt") if asked.get(name) is not None}
+
+    '''
+    BEHAVIOUR:
+    Gathers the commissions into spans: a run of dates from one site (at one sampling) that any number of commissions share; along with every target any of them asks for.
+    '''
+    def spans(self):
+        sites = defaultdict(list)
+        for number, commission in enumerate(self.commissions):
+            site = (commission["vantage"]["latitude"], commission["vantage"]["longitude"], commission["cadence"], commission["adaptive"])
+            sites[site].append(number)
+
+        spans = []
+        for numbers in sites.values():
+            numbers.sort(key=lambda number: self.commissions[number]["date"])
+            span = None
+            for number in numbers:
+                commission = self.commissions[number]
+                end = commission["date"] + timedelta(days=commission["days"])
+                if span is None or commission["date"] > span["end"]:
+                    span = {
+                        "vantage": commission["vantage"],
+                        "date": commission["date"],
+                        "end": end,
+                        "cadence": commission["cadence"],
+                        "adaptive": commission["adaptive"],
+                        "targets": [],
+                        "commissions": []
+                    }
+                    spans.append(span)
+                span["end"] = max(span["end"], end)
+                span["commissions"].append(number)
+                span["targets"] += [target for target in commission["targets"] if target not in span["targets"]]
+
+        return spans
+
+    '''
+    BEHAVIOUR:
+    Sees every commission done: each span divined (once) and each chart drawn from its portion of the span, across the pool of scribes; then writes up the timing report, which is also returned.
+    A commission that fails is noted as such in the report, rather than stopping the rest.
+    '''
+    def run(self):
+        started = time.perf_counter()
+        spans = self.spans()
+        report = [None] * len(self.commissions)
+
+        with ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=multiprocessing.get_context('spawn'),
+            initializer=_awaken_scribe,
+            initargs=(self.fast_stars,)
+        ) as scribes:
+            divinations = {
+                scribes.submit(_divine_span, span["vantage"], span["date"], (span["end"] - span["date"]).days, span["targets"], span["cadence"], span["adaptive"]): number
+                for number, span in enumerate(spans)
+            }
+            drawings = {}
+            for divination in as_completed(divinations):
+                span_number = divinations[divination]
+                span = spans[span_number]
+                try:
+                    vision, divined_seconds = divination.result()
+                except Exception as failure:
+                    for number in span["commissions"]:
+                        report[number] = self._noted(number, span_number, span, None, None, started, failure)
+                    continue
+
+                for number in span["commissions"]:
+                    commission = self.commissions[number]
+                    portion = vision.portion(
+                        (commission["date"] - span["date"]).days,
+                        commission["days"],
+                        self._destination_indices(span, commission["targets"])
+                    )
+                    drawings[scribes.submit(_draw_commission, commission, portion)] = (number, span_number, divined_seconds)
+
+            for drawing in as_completed(drawings):
+                number, span_number, divined_seconds = drawings[drawing]
+                try:
+                    drawn_seconds, failure = drawing.result(), None
+                except Exception as failed:
+                    drawn_seconds, failure = None, failed
+                report[number] = self._noted(number, span_number, spans[span_number], divined_seconds, drawn_seconds, started, failure)
+
+        summary = {
+            "manifest": os.path.abspath(self.manifest_path),
+            "workers": self.workers,
+            "commissions": len(self.commissions),
+            "spans": len(spans),
+            "elapsed_seconds": round(time.perf_counter() - started, 3),
+            "jobs": report
+        }
+        os.makedirs(os.path.dirname(self.report_path), exist_ok=True)
+        with open(self.report_path, "w") as report_file:
+            json.dump(summary, report_file, indent=2)
+
+        return summary
+
+    '''
+    MECHANISM:
+    Where the destinations of the given targets are to be found among those of a span (a target such as "Planets" being several destinations)
+    '''
+    @staticmethod
+    def _destination_indices(span, targets):
+        places, placed = {}, 0
+        for target in span["targets"]:
+            count = len(Tiphys.destinations(target))
+            places[target] = range(placed, placed + count)
+            placed += count
+        return [index for target in targets for index in places[target]]
+
+    '''
+    KNOWLEDGE:
+    The report of a single commission: its share of its span's divining (which was done once for all of the span's commissions), how long its own chart took to draw, and when (after the run began) it was done
+    '''
+    def _noted(self, number, span_number, span, divined_seconds, drawn_seconds, started, failure=None):
+        commission = self.commissions[number]
+        noted = {
+            "name": commission["name"],
+            "out": commission["out"],
+            "span": span_number,
+            "span_shared_by": len(span["commissions"]),
+            "divine_seconds": None if divined_seconds is None else round(divined_seconds, 3),
+            "draw_seconds": None if drawn_seconds is None else round(drawn_seconds, 3),
+            "done_after_seconds": round(time.perf_counter() - started, 3)
+        }
+        if failure is not None:
+            noted["error"] = f"{type(failure).__name__}: {failure}"
+        return noted
+
+# KNOWLEDGE: the Idmon each scribe consults (i.e. one per process), and the application his widgets belong to
+_idmon = None
+_scriptorium = None
+
+'''
+MECHANISM:
+Awakens a scribe in the pool, as his process starts: his Idmon loads the almanac here, just the once
+'''
+def _awaken_scribe(fast_stars):
+    global _idmon, _scriptorium
+    _scriptorium = open_scriptorium()
+    _idmon = Idmon(memory_path=None, fast_stars=fast_stars)
+
+'''
+MECHANISM:
+Records a single segment of an animation (just the given turns of the day) in a scribe's process, from the transcript of the chart
+'''
+def _record_segment(transcript, segment_file, day_cap, encoding, turns):
+    global _scriptorium
+    _scriptorium = open_scriptorium()
+    date, days, destinations, prophecies, presentation = transcript
+    scribe = Scribe()
+    scribe.transcribe(date, days, destinations, prophecies, **presentation)
+    scribe.astraeus.artboard.record_animation(segment_file, day_cap, encoding, turns)
+
+'''
+MECHANISM:
+Divines a span of days (for every one of its targets) in a scribe's process, noting how long it took
+'''
+def _divine_span(vantage, date, days, targets, cadence, adaptive):
+    began = time.perf_counter()
+    destinations = [destination for name in targets for destination in Tiphys.destinations(name)]
+    vision = _idmon.foresee(vantage, date, days, destinations, cadence=cadence, adaptive=adaptive)
+    return vision, time.perf_counter() - began
+
+'''
+MECHANISM:
+Draws (and writes) a single commission's chart from its portion of a vision, in a scribe's process, noting how long it took
+'''
+def _draw_commission(commission, vision):
+    began = time.perf_counter()
+    destinations = [destination for name in commission["targets"] for destination in Tiphys.destinations(name)]
+    scribe = Scribe()
+    scribe.inscribe_vision(
+        vision,
+        destinations,
+        layers=commission["layers"],
+        altitudes=commission["altitudes"],
+        threshold=commission["threshold"],
+        density_days=commission["density_days"],
+        twilight_raster=commission["twilight_raster"]
+    )
+    os.makedirs(os.path.dirname(commission["out"]) or '.', exist_ok=True)
+    scribe.save(commission["out"], commission["day_cap"], commission["encoding"])
+    return time.perf_counter() - began
+
+'''
+MECHANISM:
+Reads a resolution from the command line, as argparse would have it: a bad one is a usage error, not a crash mid-inquiry
+'''
+def _cadence(minutes):
+    try:
+        return Kairos.true_cadence(minutes)
+    except ValueError as oops:
+        raise argparse.ArgumentTypeError(str(oops))
+
+'''
+KNOWLEDGE:
+What can be asked of the scriptorium from the command line: a single chart, or a manifest of them
+'''
+def parse_commission(args):
+    parser = argparse.ArgumentParser(
+        description="Writes SkyQuest charts (PNG) or animations (MP4) without the GUI; one from the arguments given, or a batch from a manifest"
+    )
+    parser.add_argument("--manifest", help="a manifest (JSON or TOML) of commissions to run as a batch, in place of the single chart arguments")
+    parser.add_argument("--workers", type=int, help="how many processes to share the work between: a manifest's commissions (default one per core), or the segments of a single animation (default 1)")
+    parser.add_argument("--lat", type=float, help="latitude of the vantage (degrees)")
+    parser.add_argument("--lon", type=float, help="longitude of the vantage (degrees)")
+    parser.add_argument("--date", type=date.fromisoformat, default=date.today(), help="first date (YYYY-MM-DD), default today")
+    parser.add_argument("--days", type=int, default=7, choices=range(1, 1000), metavar="1..999", help="duration in days (default 7)")
+    parser.add_argument("--target", action="append", choices=list(Tiphys.targets), help="what to look at (may be repeated), default Planets")
+    parser.add_argument("--altitudes", type=float, nargs=2, metavar=("MIN", "MAX"), help="altitude range of the chart (degrees)")
+    parser.add_argument("--threshold", type=float, help="altitude of the threshold guide (degrees)")
+    parser.add_argument("--density-days", type=int, help="beyond this many days, arcs are shown as density images rather than drawn one by one (default 60)")
+    parser.add_argument("--twilight-raster", action="store_true", help="weave every day's day bands into the background, rather than showing just the last day's")
+    parser.add_argument("--hide", action="append", default=[], choices=["bands", "lunar", "main", "threshold", "grid"], help="a layer to hide (may be repeated)")
+    parser.add_argument("--resolution", type=_cadence, default=60, help="sampling resolution, in minutes, dividing the hour (default 60)")
+    parser.add_argument("--adaptive", action="store_true", help="sample hourly, at the resolution only around horizon crossings and culmination")
+    parser.add_argument("--fast-stars", action="store_true", help="glance at fixed stars rather than a full reduction")
+    parser.add_argument("--day-cap", type=int, help="for animations: most days of arcs shown at a time (default all)")
+    parser.add_argument("--codec", help="for animations: the FFMPEG video codec (default libx264)")
+    parser.add_argument("--crf", type=int, help="for animations: the codec's constant rate factor, lower is better (default 23)")
+    parser.add_argument("--preset", help="for animations: the codec's speed/size preset (default medium)")
+    parser.add_argument("--pix-fmt", help="for animations: the pixel format written (default yuv420p)")
+    parser.add_argument("--out", help="file to write: .mp4 for an animation, otherwise an image (e.g. .png)")
+
+    commission = parser.parse_args(args)
+    if commission.manifest is None and None in (commission.lat, commission.lon, commission.out):
+        parser.error("--lat, --lon and --out are required (unless a --manifest is given)")
+    return commission
+
+'''
+BEHAVIOUR:
+Fulfils a commission from the command line: the chart is divined, drawn and written to file (or the whole manifest is), then we are done.
+'''
+def main(args=None):
+    commission = parse_commission(sys.argv[1:] if args is None else args)
+
+    if commission.manifest:
+        summary = Armarius(commission.manifest, commission.workers).run()
+        for job in summary["jobs"]:
+            outcome = job.get("error", f"divined in {job['divine_seconds']}s (shared by {job['span_shared_by']}), drawn in {job['draw_seconds']}s")
+            print(f"{job['name']}: {outcome}")
+        print(f"{summary['commissions']} commissions from {summary['spans']} spans in {summary['elapsed_seconds']}s")
+        return
+
+    app = open_scriptorium()
+
+    destinations = [destination for name in (commission.target or ["Planets"]) for destination in Tiphys.destinations(name)]
+    scribe = Scribe(Idmon(fast_stars=commission.fast_stars))
+    scribe.inscribe(
+        {"latitude": commission.lat, "longitude": commission.lon},
+        commission.date,
+        commission.days,
+        destinations,
+        cadence=commission.resolution,
+        adaptive=commission.adaptive,
+        layers={name: False for name in commission.hide},
+        altitudes=commission.altitudes,
+        threshold=commission.threshold,
+        density_days=commission.density_days,
+        twilight_raster=commission.twilight_raster
+    )
+    os.makedirs(os.path.dirname(commission.out) or '.', exist_ok=True)
+    scribe.save(commission.out, commission.day_cap, Armarius.encoding(vars(commission)), commission.workers)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+from continuum import *
+'''
+THROUGHLINE:
+Checks on the animation mechanics of the inscriptions, played out against a stand-in for the parchment (so no GUI is needed).
+'''
+from inscriptions import Inscriptions
+from parchment import InnerChartElements
+
+'''
+AFFORDANCE:
+Just enough of a parchment for the arc limiter: it keeps the marks made, and decays them as the parchment itself does.
+'''
+class Scrap:
+    class Mark:
+        def __init__(self, path):
+            self.path = path
+            self.removed = False
+
+        def set_segments(self, paths):
+            self.path = paths[0]
+
+        def remove(self):
+            self.removed = True
+
+    decay_line = staticmethod(InnerChartElements.decay_line)
+
+    def add_lines(self, segments, colour_defs, linewidths, zorder):
+        return self.Mark(segments[0]), None
+
+    @staticmethod
+    def extend_line(collection, path, colour, linewidth):
+        collection.set_segments([path])
+
+'''
+MECHANISM:
+Plays one arc's days through the arc limiter as an animation would (see Inscriptions.perform), each day's arc having as many segments (spread evenly across the day) as it is given; returning how many days' arcs are shown at the end of each turn of the day.
+'''
+def play_trail(counts, day_cap):
+    vertices = np.vstack([np.column_stack([np.linspace(0, 24, count + 1), np.zeros(count + 1)]) for count in counts])
+    offsets = np.concatenate([[0], np.cumsum(np.array(counts) + 1)])
+    limiter = Inscriptions.ArcLimiter(Scrap(), vertices)
+    tracker = Inscriptions.DayTracker(day_cap, len(counts))
+
+    shown = []
+    while tracker.more_days:
+        day = tracker.day
+        hours = vertices[offsets[day]:offsets[day + 1] - 1, 0].astype(int)
+        for hour in range(25):
+            if tracker.too_many_days:
+                limiter.expire(tracker.day - tracker.day_cap, hour)
+            if tracker.end_of_days:
+                continue
+            for segment in np.flatnonzero(hours == hour):
+                limiter.extend("arcs", 0, day, segment == 0, offsets[day] + segment, None, 4, 2)
+        tracker.step_day()
+        shown.append(len(limiter.current_collections["arcs", 0]))
+    return shown
+
+def test_hourly_trail_holds_to_the_day_cap():
+    assert play_trail([24] * 8, 5) == [1, 2, 3, 4, 5, 5, 5, 5, 4, 3, 2, 1, 0]
+
+def test_adaptive_trail_holds_to_the_day_cap():
+    # KNOWLEDGE: adaptive sampling gives days differing numbers of segments (these are Saturn's, fewer as the month goes on)
+    counts = [134, 131, 127, 124, 120, 118, 115, 112]
+    assert play_trail(counts, 5) == [1, 2, 3, 4, 5, 5, 5, 5, 4, 3, 2, 1, 0]
+    assert play_trail(counts[::-1], 5) == [1, 2, 3, 4, 5, 5, 5, 5, 4, 3, 2, 1, 0]
+
+def test_trail_expires_the_oldest_day_as_the_day_goes_by():
+    vertices = np.column_stack([np.linspace(0, 24, 13), np.zeros(13)])
+    limiter = Inscriptions.ArcLimiter(Scrap(), vertices)
+    limiter.extend("arcs", 0, 0, True, 0, None, 4, 2)
+    for first in range(1, 12):
+        limiter.extend("arcs", 0, 0, False, first, None, 4, 2)
+
+    # KNOWLEDGE: the segments begin every two hours, so by hour 5 three of them (at hours 0, 2 and 4) are gone
+    assert limiter.expire(0, 5)
+    mark, start, end, day = limiter.current_collections["arcs", 0][0]
+    assert (start, end) == (3, 13)
+    assert np.array_equal(mark.path, vertices[3:13])
+    assert not limiter.expire(0, 5)
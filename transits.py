@@ -32,7 +32,7 @@ In-code, SkyQuest is presented as a cast of ancient greek mythological figures a
 '''
 world = True # I haven't properly coded semantic/lexical associations yet so this is just here to ensure the WORLD view gets extracted!
 
-from aeonforge import Chronos, Kairos
+from aeonforge import Chronos, Horae, Kairos
 from astraeus import Astraeus
 
 # --- Tiphys: Navigator of Location ---
@@ -41,6 +41,40 @@ FIGURATION:
 Tiphys was the Argonaut's navigator, and here takes care of location based concepts - i.e where we are and where we are going.
 '''
 class Tiphys(QWidget):
+    '''
+    KNOWLEDGE:
+    Right now we have small, hand curated, list of celestial references. Really, this ought  to get loaded from a JSON file, with some kind of tool to support maintaing that by navigating the options within our almanac.
+    '''
+    targets = {
+        "M42 (Orion Nebula)": (5.588139, -5.391111),
+        "M27 (Dumbbell Nebula)": (19.993417, 22.721111),
+        "M57 (Ring Nebula)": (18.893083, 33.029167),
+        "M76 (Little Dumbbell)": (1.705278, 51.575278),
+        "NGC 7000 (North America Nebula)": (20.971389, 44.528611),
+        "IC 5070 (Pelican Nebula)": (20.85, 44.0),
+        "NGC 6960 (Veil West)": (20.760556, 30.716667),
+        "NGC 6992 (Veil East)": (20.933333, 31.716667),
+        "NGC 7635 (Bubble Nebula)": (23.346667, 61.201667),
+        "M8 (Lagoon Nebula)": (18.05, -24.383333),
+        "M20 (Trifid Nebula)": (18.033333, -23.033333),
+        "M16 (Eagle Nebula)": (18.3, -13.783333),
+        "M17 (Swan Nebula)": (18.333333, -16.183333),
+        "NGC 6888 (Crescent Nebula)": (20.2, 38.35),
+        "IC 1318 (Sadr Region)": (20.333333, 40.5),
+        "NGC 7023 (Iris Nebula)": (21.016667, 68.166667),
+        "NGC 457 (Owl Cluster)": (1.325722, 58.290833),
+        # NB. we group the planets together at the end so we can commprehend the list laters...
+        #     also in order of reducing orbit
+        "Neptune": "neptune barycenter",
+        "Uranus": "uranus barycenter",
+        "Saturn": "saturn barycenter",
+        "Jupiter": "jupiter barycenter",
+        "Mars": "mars",
+        "Venus": "venus",
+        "Mercury": "mercury",
+        "Planets": "all planet arcs"
+    }
+
     def __init__(self):
         super().__init__()
         self.layout = QHBoxLayout()
@@ -60,41 +94,6 @@ class Tiphys(QWidget):
         self.latitude = self.homebase.get_location()["latitude"]
         self.longitude = self.homebase.get_location()["longitude"]
 
-
-        '''
-        KNOWLEDGE:
-        Right now we have small, hand curated, list of celestial references. Really, this ought  to get loaded from a JSON file, with some kind of tool to support maintaing that by navigating the options within our almanac.
-        '''
-        self.targets = {
-            "M42 (Orion Nebula)": (5.588139, -5.391111),
-            "M27 (Dumbbell Nebula)": (19.993417, 22.721111),
-            "M57 (Ring Nebula)": (18.893083, 33.029167),
-            "M76 (Little Dumbbell)": (1.705278, 51.575278),
-            "NGC 7000 (North America Nebula)": (20.971389, 44.528611),
-            "IC 5070 (Pelican Nebula)": (20.85, 44.0),
-            "NGC 6960 (Veil West)": (20.760556, 30.716667),
-            "NGC 6992 (Veil East)": (20.933333, 31.716667),
-            "NGC 7635 (Bubble Nebula)": (23.346667, 61.201667),
-            "M8 (Lagoon Nebula)": (18.05, -24.383333),
-            "M20 (Trifid Nebula)": (18.033333, -23.033333),
-            "M16 (Eagle Nebula)": (18.3, -13.783333),
-            "M17 (Swan Nebula)": (18.333333, -16.183333),
-            "NGC 6888 (Crescent Nebula)": (20.2, 38.35),
-            "IC 1318 (Sadr Region)": (20.333333, 40.5),
-            "NGC 7023 (Iris Nebula)": (21.016667, 68.166667),
-            "NGC 457 (Owl Cluster)": (1.325722, 58.290833),
-            # NB. we group the planets together at the end so we can commprehend the list laters...
-            #     also in order of reducing orbit
-            "Neptune": "neptune barycenter",
-            "Uranus": "uranus barycenter",
-            "Saturn": "saturn barycenter",
-            "Jupiter": "jupiter barycenter",
-            "Mars": "mars",
-            "Venus": "venus",
-            "Mercury": "mercury",
-            "Planets": "all planet arcs"
-        }
-
         for name in self.targets:
             self.target_selector.addItem(name)
 
@@ -122,13 +121,20 @@ class Tiphys(QWidget):
     '''
     @property
     def destination(self):
-        name = self.target_selector.currentText()
-        value = self.targets[name]
+        return self.destinations(self.target_selector.currentText())
+
+    '''
+    MECHANISM:
+    The things to observe for any named target (so we needn't have a target selector to hand, e.g. from the command line)
+    '''
+    @classmethod
+    def destinations(cls, name):
+        value = cls.targets[name]
 
         if isinstance(value, str):
             # Planet identifier, defer to Idmon to resolve
             if name.lower() == "planets":
-                planet_items = list(self.targets.items())[-8:-1]  # exclude "Planets" itself
+                planet_items = list(cls.targets.items())[-8:-1]  # exclude "Planets" itself
                 return [
                     {"name": pname, "skyfield_id": pval}
                     for pname, pval in planet_items
@@ -147,6 +153,19 @@ class Tiphys(QWidget):
             }]
 
 
+    '''
+    KNOWLEDGE:
+    What to call a set of destinations on a chart.
+    Right now we only have 1 grouped option, the planets so Tiphys doesn't bother to give us a name for a group of destinations!!! Any other mix (as we might ask for from the command line) is simply listed.
+    '''
+    @staticmethod
+    def designation(destinations):
+        if len(destinations) == 1:
+            return destinations[0]["name"]
+        if all("skyfield_id" in destination for destination in destinations):
+            return "Major Planets"
+        return ", ".join(destination["name"] for destination in destinations)
+
     '''
     MECHANISM:
     Although ancient, Tiphys is fully up-to-date with GDPR type concerns. The vantage (home location) is hidden behind a buttton so it isn't captured by any screen grabs.
@@ -177,129 +196,802 @@ class Tiphys(QWidget):
             }
 
 
+# --- Mnemosyne: Keeper of Past Prophecies ---
+'''
+FIGURATION:
+Mnemosyne is the goddess of memory (and mother of the muses). She sits at Idmon's side and remembers every prophecy he has made, on disk, so that when we come back to the same vantage, dates and destinations he need not consult the almanac again.
+Her memories are kept in a small sqlite scroll. Each one is filed under a versioned key of: where we stood (latitude and longitude, rounded to a configurable precision), the local date, what we looked at (and how closely we sampled it), and which almanac was consulted. Should her scroll grow too long, she forgets the least recently recalled memories first.
+'''
+class Mnemosyne:
+    # KNOWLEDGE: bumped whenever the shape or meaning of what we remember changes, so old memories quietly lapse rather than mislead
+    version = 2
+
+    # KNOWLEDGE: what we remember about each date, other than the destinations themselves
+    lunar = "lunar"
+    twilight = "twilight"
+
+    def __init__(self, path, almanac, precision=3, max_bytes=256 * 1024 * 1024):
+        self.path = path
+        self.almanac = almanac
+        self.precision = precision
+        self.max_bytes = max_bytes
+
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        with self._scroll() as scroll:
+            scroll.execute(
+                "CREATE TABLE IF NOT EXISTS memories "
+                "(key TEXT PRIMARY KEY, payload BLOB, size INTEGER, last_used REAL)"
+            )
+
+    '''
+    MECHANISM:
+    Opens the scroll afresh for each consultation (committing and closing it afterwards); cheap enough, and it means any thread (or process) can ask.
+    '''
+    @contextmanager
+    def _scroll(self):
+        scroll = sqlite3.connect(self.path, timeout=30)
+        try:
+            with scroll:
+                yield scroll
+        finally:
+            scroll.close()
+
+    '''
+    KNOWLEDGE:
+    The name by which we remember a destination: planets by their almanac id, everything else by where it sits in the sky (and whether Idmon only glanced at it)
+    '''
+    @staticmethod
+    def target_id(destination, glanced=False):
+        if "skyfield_id" in destination:
+            return destination["skyfield_id"]
+        return f"{'glance' if glanced else 'radec'}:{destination['ra_hours']:.6f}:{destination['dec_degrees']:.6f}"
+
+    '''
+    KNOWLEDGE:
+    An arc is only remembered at the cadence (and adaptiveness) it was sampled at, so we note those alongside what was looked at
+    '''
+    @staticmethod
+    def sampled(aspect, cadence, adaptive=False):
+        return f"{aspect}@{cadence}m{'~' if adaptive else ''}"
+
+    '''
+    KNOWLEDGE:
+    The (versioned) key of a single memory
+    '''
+    def key(self, vantage, date, target_id):
+        return "|".join([
+            f"v{self.version}",
+            f"{vantage['latitude']:.{self.precision}f}",
+            f"{vantage['longitude']:.{self.precision}f}",
+            date.isoformat(),
+            target_id,
+            self.almanac
+        ])
+
+    '''
+    MECHANISM:
+    Recalls whatever we remember of the given (date, target_id) pairs, as a dict keyed by those pairs. Anything not remembered is simply absent.
+    '''
+    def recall(self, vantage, wanted):
+        keys = {self.key(vantage, date, target_id): (date, target_id) for date, target_id in wanted}
+        memories = {}
+        if not keys:
+            return memories
+
+        with self._scroll() as scroll:
+            found = []
+            key_list = list(keys)
+            # sqlite limits how many values we can ask about at once
+            for i in range(0, len(key_list), 500):
+                chunk = key_list[i:i + 500]
+                rows = scroll.execute(
+                    f"SELECT key, payload FROM memories WHERE key IN ({','.join('?' * len(chunk))})", chunk
+                ).fetchall()
+                for key, payload in rows:
+                    memories[keys[key]] = pickle.loads(payload)
+                    found.append(key)
+
+            now = time.time()
+            scroll.executemany("UPDATE memories SET last_used = ? WHERE key = ?", [(now, key) for key in found])
+
+        return memories
+
+    '''
+    MECHANISM:
+    Commits new memories (a dict keyed by (date, target_id) pairs) to the scroll, then forgets the stalest ones if the scroll has grown too long.
+    '''
+    def inscribe(self, vantage, memories):
+        if not memories:
+            return
+
+        now = time.time()
+        rows = []
+        for (date, target_id), memory in memories.items():
+            payload = pickle.dumps(memory, protocol=pickle.HIGHEST_PROTOCOL)
+            rows.append((self.key(vantage, date, target_id), payload, len(payload), now))
+
+        with self._scroll() as scroll:
+            scroll.executemany("INSERT OR REPLACE INTO memories VALUES (?, ?, ?, ?)", rows)
+            self._forget(scroll)
+
+    '''
+    MECHANISM:
+    Least recently recalled memories are forgotten first, until the scroll is back within its allotted size
+    '''
+    def _forget(self, scroll):
+        total = scroll.execute("SELECT COALESCE(SUM(size), 0) FROM memories").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+
+        forgotten = []
+        for key, size in scroll.execute("SELECT key, size FROM memories ORDER BY last_used"):
+            if total <= self.max_bytes:
+                break
+            forgotten.append((key,))
+            total -= size
+        scroll.executemany("DELETE FROM memories WHERE key = ?", forgotten)
+
+
+# --- Augury: A Single Reading of the Heavens ---
+'''
+FIGURATION:
+An augury is a single reading of the signs: from one vantage, over one run of days, at one cadence.
+Everything that Idmon used to keep about "the current query" (where we stand, when, and the observatory positions at every sample) lives in an augury of its own instead; which is never changed once taken and which nobody else shares. So Idmon himself only holds what never changes (the almanac and its timescale), and any number of threads can consult him at once.
+'''
+class Augury:
+    __slots__ = ('vantage', 'date', 'days', 'cadence', 'adaptive', 'hours', 'observer', 'location', 'noons_tt', 'obs')
+
+    '''
+    MECHANISM:
+    Takes the reading: the observatory's position at each (sampled) hour of each day, counted out from each noon.
+    Adaptively (see Idmon._sharpen) the reading is hourly, with the cadence only applying to the closer looks taken later.
+    '''
+    def __init__(self, idmon, vantage, date, days, cadence=60, adaptive=False):
+        self.vantage = dict(vantage)
+        self.date = date
+        self.days = days
+        self.cadence = cadence
+        self.adaptive = adaptive and cadence < 60
+        self.hours = Idmon.hour_grid(60 if self.adaptive else cadence)
+        self.observer = Topos(latitude_degrees=vantage["latitude"], longitude_degrees=vantage["longitude"])
+        self.location = idmon.ephemeris['earth'] + self.observer
+
+        # Step 1: the UTC noon of each day (as a TT Julian date), from Kairos
+        self.noons_tt = idmon.ts.utc(Kairos.true_noons(date, days)).tt
+
+        # Step 2: Skyfield time array, every hour of every day, counted out from each noon
+        t_array = idmon.ts.tt_jd((self.noons_tt[:, np.newaxis] + self.hours / 24).ravel())
+
+        # Step 3: Batched observatory positions
+        self.obs = self.location.at(t_array)
+
+# --- Vision: What Idmon Saw ---
+'''
+FIGURATION:
+A vision is everything Idmon foresaw in a single augury: per day, the lunar arc, its illumination, the arcs of each destination and the (compact) twilight bands.
+Once seen, a vision can't be changed (its arrays included), so it can be handed between threads, or kept, without anyone worrying about who else holds it.
+'''
+class Vision:
+    __slots__ = ('vantage', 'dates', 'cadence', 'adaptive', 'moon_arcs', 'illumination', 'target_arcs', 'twilight')
+
+    def __init__(self, **seen):
+        for name in self.__slots__:
+            object.__setattr__(self, name, self._fixed(seen[name]))
+
+    '''
+    MECHANISM:
+    Fixes what was seen, so it stays seen: sequences become tuples and arrays become read-only
+    '''
+    @classmethod
+    def _fixed(cls, seen):
+        if isinstance(seen, np.ndarray):
+            seen = seen.view()
+            seen.flags.writeable = False
+            return seen
+        if isinstance(seen, (list, tuple)):
+            return tuple(cls._fixed(part) for part in seen)
+        return seen
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"OOPS:: a vision, once seen, can't be changed ({name})")
+
+    # KNOWLEDGE: a vision can be passed between processes (e.g. from the Sibyls), where it is fixed all over again
+    def __getstate__(self):
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __setstate__(self, seen):
+        for name in self.__slots__:
+            object.__setattr__(self, name, self._fixed(seen[name]))
+
+    '''
+    MECHANISM:
+    Joins the visions of consecutive runs of days (from the same vantage, at the same cadence) into a single vision of them all, in the order given
+    '''
+    @classmethod
+    def join(cls, visions):
+        first = visions[0]
+        return cls(
+            vantage=first.vantage,
+            dates=[day_date for vision in visions for day_date in vision.dates],
+            cadence=first.cadence,
+            adaptive=first.adaptive,
+            moon_arcs=[arc for vision in visions for arc in vision.moon_arcs],
+            illumination=[illum for vision in visions for illum in vision.illumination],
+            target_arcs=[[arc for vision in visions for arc in vision.target_arcs[i]] for i in range(len(first.target_arcs))],
+            twilight=None if first.twilight is None else [bands for vision in visions for bands in vision.twilight]
+        )
+
+    def __len__(self):
+        return len(self.dates)
+
+    '''
+    MECHANISM:
+    A portion of the vision: a run of its days (from the first given), and only the given destinations (by index), e.g. for a chart of just part of what was foreseen
+    '''
+    def portion(self, first, days, targets=None):
+        days_seen = slice(first, first + days)
+        if targets is None:
+            targets = range(len(self.target_arcs))
+        return Vision(
+            vantage=self.vantage,
+            dates=self.dates[days_seen],
+            cadence=self.cadence,
+            adaptive=self.adaptive,
+            moon_arcs=self.moon_arcs[days_seen],
+            illumination=self.illumination[days_seen],
+            target_arcs=[self.target_arcs[i][days_seen] for i in targets],
+            twilight=None if self.twilight is None else self.twilight[days_seen]
+        )
+
+    '''
+    MECHANISM:
+    A single day's prophecy, as Idmon foretells it: (moon_arc, illumination, target_arcs, twilight)
+    '''
+    def day(self, day):
+        twilight = self.twilight[day] if self.twilight is not None else None
+        return self.moon_arcs[day], self.illumination[day], [arcs[day] for arcs in self.target_arcs], twilight
+
 # --- Idmon: Oracle of Celestial Motion ---
 '''
 FIGURATION:
 Idmon was a seer for the Argonauts, in fact he foresaw his own death on the voyage but went along anyway...
-This quest is a little easier for him, he consults the almanacs to tell us where things are on a given hour. 
+This quest is a little easier for him, he consults the almanacs to tell us where things are on a given hour.
 He always tracks the sun and the moon and informs us about the daylight, twilight and night-time bands for any given date; along with the moon-illumination at each hour of a given date.
-Obvs, we also get the altitude data for observed objects on a (24) hourly basis for any given date.
-He's kind of micro-managed, so if we want data for multiple days, or multiple target objects on a given date, he has to be re-consulted.
+Obvs, we also get the altitude data for observed objects on a (24) hourly basis for any given date; or more often than that, should we ask for a finer cadence. Asked to be adaptive he samples hourly, and only looks closer where it matters: as an arc crosses the horizon and as it culminates.
+He used to be kind of micro-managed, re-consulted for every day of a multi-day query. Now he takes in the whole day range at once, and hands the results back a day at a time.
+He no longer remembers anything about the query in hand, either; each consultation takes an augury of its own and comes back as a vision (see above), so he can be consulted by many at once.
+Mnemosyne keeps his past prophecies, so he only consults the almanac about what he hasn't already foreseen. She can be dismissed (memory_path=None) if we'd rather he forgot everything.
 '''
 class Idmon:
-    def __init__(self):
+    def __init__(self, memory_path='./skyquest-cache/almanac.sqlite', memory_precision=3, fast_stars=False, sibyls=None):
         # KNOWLEDGE: this retrieves the almanac, which must have been downloaded
+        self.almanac = 'de421.bsp'
         self.loader = Loader('./skyfield-data')
         self.ts = self.loader.timescale()
-        self.ephemeris = self.loader('de421.bsp')
+        self.ephemeris = self.loader(self.almanac)
         self.moon = self.ephemeris['moon']
+        self.sun = self.ephemeris['sun']
+
+        self.mnemosyne = None
+        if memory_path is not None:
+            self.mnemosyne = Mnemosyne(memory_path, self.almanac, precision=memory_precision)
+
+        # KNOWLEDGE: the prophecy for the most recent window, per (date, aspect), along with the vantage it was made from (kept together, so it is swapped in one go)
+        self.recent = (None, {})
+
+        # KNOWLEDGE: whether Idmon takes a quick glance at fixed stars rather than a full astrometric reduction (see _glance_at_stars)
+        self.fast_stars = fast_stars
 
-        self.observer = None
-        self.obs = None
-        self.date = None
-        self.day_hours = []
-        self.location = self.ephemeris['earth']
+        # KNOWLEDGE: the most days we consult the almanac about in one go, when foretelling a range bit by bit
+        self.max_chunk_days = 64
+
+        # KNOWLEDGE: the most samples (a day at the cadence taking 24 * 60 / cadence of them) Idmon takes at a stretch for a listener who may lose interest; well under a second's work (see foresee_heeded)
+        self.heeded_samples = 4 * 24 * 60
+
+        # KNOWLEDGE: the Sibyls (if summoned, with the same fast_stars as Idmon) share out the longer spans of days between them
+        self.sibyls = sibyls
+
+        # KNOWLEDGE: the planets we have already looked up in the almanac
+        self.bodies = {}
+
+        # KNOWLEDGE: how closely we sample the daylight level when searching for twilight transitions. Skyfield's own choice is a little under an hour, which can step straight over the brief spell of true night we get around midsummer; a quarter hour does not.
+        self.twilight_step_days = 0.25 / 24
 
     '''
-    BEHAVIOUR:
-    Does the heavy-lifting needed to consult the almanac for a number of things on a given date. This takes account of the fact that the vantage point shifts (with respect to the heavens) over the course of a day due to the earth's rotation. 
-    Note that because the lunar arc is always available to the plot, **and** because we use the moon-illumination when plotting other arcs, Idmon provides those as soon as the heavy-lifting has been achieved.
+    KNOWLEDGE:
+    The hours (after noon) of a day, sampled every so many minutes
     '''
-    def set_transit(self, vantage, date):
-        self.date = date
-        self.observer = Topos(latitude_degrees=vantage["latitude"], longitude_degrees=vantage["longitude"])
-        self.location = self.ephemeris['earth'] + self.observer
-
-        # Time range: 24 hrs
-        self.day_hours = range(0, 25)
-        
-        # Step 1: Build UTC datetime list
-        dt_utcs = [Kairos.true_hour(date, h) for h in self.day_hours]
-        
-        # Step 2: Skyfield time array
-        t_array = self.ts.utc(dt_utcs)
-        
-        # Step 3: Batched observatory positions
-        self.obs = self.location.at(t_array)
+    @staticmethod
+    def hour_grid(cadence):
+        return np.arange(0, 24 * 60 + 1, cadence) / 60
+
+    '''
+    MECHANISM:
+    Takes an augury: a reading of the heavens from a vantage over a run of days, at a given cadence (in minutes), or adaptively (see _sharpen)
+    '''
+    def augur(self, vantage, date, days, cadence=60, adaptive=False):
+        return Augury(self, vantage, date, days, cadence, adaptive)
 
-        # Moon
-        moon_app = self.obs.observe(self.moon).apparent()
-        moon_alts = moon_app.altaz()[0].degrees.tolist()
-        arc_moon = (self.day_hours, moon_alts)
+    '''
+    MECHANISM:
+    Looks up a planet in the almanac (just the once)
+    '''
+    def body(self, skyfield_id):
+        if skyfield_id not in self.bodies:
+            self.bodies[skyfield_id] = self.ephemeris[skyfield_id]
+        return self.bodies[skyfield_id]
+
+    '''
+    BEHAVIOUR:
+    Does the heavy-lifting needed to consult the almanac for a number of things over a range of days. This takes account of the fact that the vantage point shifts (with respect to the heavens) over the course of a day due to the earth's rotation.
+    Every hour (or sample) of every day is in the augury's single (days x 25) time array, so the almanac is consulted just the once, however many days we ask about.
+    Note that because the lunar arc is always available to the plot, **and** because we use the moon-illumination when plotting other arcs, Idmon provides those as soon as the heavy-lifting has been achieved; as one row per day.
+    '''
+    def get_lunar_range(self, augury):
+        moon_app = augury.obs.observe(self.moon).apparent()
+        moon_alts = moon_app.altaz()[0].degrees.reshape(augury.days, -1)
 
         # Illumination
-        illum_values = moon_app.fraction_illuminated(self.ephemeris["sun"]).tolist()
+        illum_values = moon_app.fraction_illuminated(self.sun).reshape(augury.days, -1)
 
-        return arc_moon, illum_values
+        return moon_alts, illum_values
+
+    '''
+    BEHAVIOUR:
+    Provides the altitudes of a whole set of destinations over the augury's day range, as a (destinations x days x hours) matrix, without going back to the almanac for each one.
+    - Planets all share the one set of observatory positions (and Idmon remembers where he found each planet in the almanac).
+    - Fixed ra/dec objects all share one array-valued Star (unless Idmon has been asked for fast_stars, whereupon he just glances at them). Skyfield won't observe an array of stars over an array of times, but a star that doesn't move doesn't need re-observing: we take its astrometric direction once, then apply the aberration due to our own motion at each hour and turn it to our horizon ourselves. The only thing we skip is the sun's light-bending, which amounts to less than an arcsecond anywhere we would want to look at night.
+    '''
+    def get_transit_ranges(self, augury, destinations):
+        obs = augury.obs
+        target_alts = np.empty((len(destinations), augury.days, len(augury.hours)))
+
+        planets = [i for i, destination in enumerate(destinations) if "skyfield_id" in destination]
+        stars = [i for i, destination in enumerate(destinations) if "skyfield_id" not in destination]
+
+        for i in planets:
+            target_app = obs.observe(self.body(destinations[i]["skyfield_id"])).apparent()
+            target_alts[i] = target_app.altaz()[0].degrees.reshape(augury.days, -1)
+
+        if stars and self.fast_stars:
+            target_alts[stars] = self._glance_at_stars(
+                augury,
+                np.array([destinations[i]["ra_hours"] for i in stars]),
+                np.array([destinations[i]["dec_degrees"] for i in stars])
+            ).reshape(len(stars), augury.days, -1)
+
+        elif stars:
+            target = Star(
+                ra_hours=np.array([destinations[i]["ra_hours"] for i in stars]),
+                dec_degrees=np.array([destinations[i]["dec_degrees"] for i in stars])
+            )
+            # (3 x stars) directions, spread across every hour: (3 x stars x hours)
+            direction = augury.location.at(obs.t[0]).observe(target).xyz.au
+            target_au = np.repeat(direction[:, :, np.newaxis], len(obs.t), axis=2)
+            add_aberration(target_au, obs.velocity.au_per_d[:, np.newaxis, :], length_of(target_au) / C_AUDAY)
+
+            horizon = np.einsum('ijt,jst->ist', augury.observer.rotation_at(obs.t), target_au)
+            alts = np.degrees(np.arcsin(horizon[2] / length_of(horizon)))
+            target_alts[stars] = alts.reshape(len(stars), augury.days, -1)
+
+        return target_alts
 
     '''
     MECHANISM:
-    Provides the altitude of a given target at each hour of the transit date; handles both planetary and star type targets.
+    Idmon's quick glance at the fixed stars, for when we'd rather have a whole catalogue over a whole year interactively than have it to the arcsecond.
+    Each star is precessed (along with nutation and aberration) to its apparent place for the middle of the augury's day range, just the once, and from then on it's plain spherical trigonometry: the hour angle from local sidereal time, and the altitude from that, our latitude and the star's declination; for every star at every hour (or at whatever times we ask about) in one numpy sweep.
+    What he misses is how the apparent place drifts over the range (precession, and the annual swing of aberration), so the error grows with the length of the range: measured against the full skyfield reduction it stays within 0.003° over a month, 0.02° over a year and 0.03° over 999 days. That's a tiny fraction of the width of a plotted arc.
     '''
-    def get_transit_arc(self, destination):
-        if "skyfield_id" in destination:
-            self.target = self.ephemeris[destination["skyfield_id"]]
+    def _glance_at_stars(self, augury, ra_hours, dec_degrees, t=None):
+        t_range = augury.obs.t
+        t_mid = self.ts.tt_jd((t_range.tt[0] + t_range.tt[-1]) / 2)
+        if t is None:
+            t = t_range
+        ra, dec, _ = augury.location.at(t_mid).observe(Star(ra_hours=ra_hours, dec_degrees=dec_degrees)).apparent().radec(epoch='date')
+
+        # local apparent sidereal time (the equation of the equinoxes barely changes, so that is taken the once too)
+        lst = t.gmst + (t_mid.gast - t_mid.gmst) + augury.observer.longitude.degrees / 15
+        hour_angle = np.radians((lst[np.newaxis, :] - ra.hours[:, np.newaxis]) * 15)
+
+        latitude = augury.observer.latitude.radians
+        declination = dec.radians[:, np.newaxis]
+        sin_alt = np.sin(latitude) * np.sin(declination) + np.cos(latitude) * np.cos(declination) * np.cos(hour_angle)
+        return np.degrees(np.arcsin(np.clip(sin_alt, -1.0, 1.0)))
+
+    '''
+    MECHANISM:
+    Provides the means to find the altitude of the moon, or a destination, at any (flat array of) TT Julian dates across the augury's day range; taking the same care (or quick glance) that Idmon took over the range itself.
+    '''
+    def _altitude_finder(self, augury, destination=None):
+        if destination is not None and "skyfield_id" not in destination and self.fast_stars:
+            ra_hours, dec_degrees = np.array([destination["ra_hours"]]), np.array([destination["dec_degrees"]])
+            return lambda tt: self._glance_at_stars(augury, ra_hours, dec_degrees, self.ts.tt_jd(tt))[0]
+
+        if destination is None:
+            body = self.moon
+        elif "skyfield_id" in destination:
+            body = self.body(destination["skyfield_id"])
         else:
-            self.target = Star(
-                ra_hours=destination["ra_hours"],
-                dec_degrees=destination["dec_degrees"]
-            )
+            body = Star(ra_hours=destination["ra_hours"], dec_degrees=destination["dec_degrees"])
 
-        target_app = self.obs.observe(self.target).apparent()
-        target_alts = target_app.altaz()[0].degrees.tolist()
-        arc_target = (self.day_hours, target_alts)
+        return lambda tt: augury.location.at(self.ts.tt_jd(tt)).observe(body).apparent().altaz()[0].degrees
 
-        return arc_target
+    '''
+    BEHAVIOUR:
+    Idmon's adaptive sampling. Given the (hourly) altitudes of some arcs over the augury's day range, as (days x hours) rows, he takes a closer look (at the cadence) wherever it matters: the hour in which an arc crosses the horizon (and the hours either side of that), and the hours either side of where it culminates (above the pole or below it). Everywhere else a straight line between the hours is near enough, within half a degree.
+    Each arc's closer looks, across every day of the range, are taken in one go; then merged with its hourly samples, in order, a day at a time. So each day of each arc comes back as its own (hours, altitudes) pair, of however many samples it needed.
+    '''
+    def _sharpen(self, augury, coarse_alts, altitude_finders):
+        hours = augury.hours
+        closer = np.arange(augury.cadence, 60, augury.cadence) / 60
+
+        arcs = []
+        for alts, altitude_at in zip(coarse_alts, altitude_finders):
+            # the hours (between one sample and the next) that need a closer look
+            crossing = np.signbit(alts[:, :-1]) != np.signbit(alts[:, 1:])
+            rising, falling = alts[:, 1:-1] >= alts[:, :-2], alts[:, 1:-1] >= alts[:, 2:]
+            summit = rising == falling
+            closer_look = crossing.copy()
+            closer_look[:, :-1] |= summit | crossing[:, 1:]
+            closer_look[:, 1:] |= summit | crossing[:, :-1]
+            day, hour = np.nonzero(closer_look)
+
+            close_day = np.repeat(day, len(closer))
+            close_hours = (hours[hour][:, np.newaxis] + closer).ravel()
+            close_alts = np.empty(0)
+            if len(close_hours):
+                close_alts = altitude_at(augury.noons_tt[close_day] + close_hours / 24)
+
+            # merge with the hourly samples, in order of day then hour
+            all_days = np.concatenate((np.repeat(np.arange(augury.days), len(hours)), close_day))
+            all_hours = np.concatenate((np.tile(hours, augury.days), close_hours))
+            all_alts = np.concatenate((alts.ravel(), close_alts))
+            order = np.lexsort((all_hours, all_days))
+            splits = np.cumsum(np.bincount(all_days, minlength=augury.days))[:-1]
+            arcs.append(list(zip(np.split(all_hours[order], splits), np.split(all_alts[order], splits))))
+
+        return arcs
+
+    '''
+    BEHAVIOUR:
+    Idmon's reentrant prophecy. Takes an augury of its own for the given vantage, day range and cadence, and returns everything foreseen as a (fixed) vision. Nothing is remembered by Idmon himself, so this is safe to ask from as many threads as we like (Mnemosyne is neither asked nor told; see divine_days for that).
+    The twilight can be left unforeseen (twilight=False), for when it's already known.
+    '''
+    def foresee(self, vantage, date, days, destinations, cadence=60, adaptive=False, twilight=True):
+        augury = self.augur(vantage, date, days, cadence, adaptive)
+
+        moon_alts, illum_values = self.get_lunar_range(augury)
+        moon_arcs = [(augury.hours, alts) for alts in moon_alts]
+        if augury.adaptive:
+            moon_arcs = self._sharpen(augury, [moon_alts], [self._altitude_finder(augury)])[0]
+
+        target_arcs = []
+        if destinations:
+            target_alts = self.get_transit_ranges(augury, destinations)
+            target_arcs = [[(augury.hours, alts) for alts in arc_alts] for arc_alts in target_alts]
+            if augury.adaptive:
+                target_arcs = self._sharpen(augury, target_alts, [self._altitude_finder(augury, destination) for destination in destinations])
+
+        return Vision(
+            vantage=augury.vantage,
+            dates=[date + timedelta(days=day) for day in range(days)],
+            cadence=augury.cadence,
+            adaptive=augury.adaptive,
+            moon_arcs=moon_arcs,
+            illumination=[(augury.hours, illum) for illum in illum_values],
+            target_arcs=target_arcs,
+            twilight=self.get_twilight_range(augury) if twilight else None
+        )
+
+    '''
+    BEHAVIOUR:
+    Consults the almanac about everything we need for a whole day range, then hands back the prophecy day by day: the lunar arc, its illumination, the arcs of the destinations and the (compact) twilight bands.
+    '''
+    def divine_range(self, vantage, date, days, destinations, cadence=60, adaptive=False):
+        return [prophecy for _, prophecy in self.divine_days(vantage, date, days, destinations, cadence=cadence, adaptive=adaptive)]
+
+    '''
+    MECHANISM:
+    Just as foresee, but a stretch of days at a time (none of them much more than half a second's work, see heeded_samples) for a listener who may lose interest part way; giving up, with nothing, as soon as they do
+    '''
+    def foresee_heeded(self, vantage, date, days, destinations, cadence, adaptive, twilight, heeded):
+        stretch = max(1, self.heeded_samples * cadence // (24 * 60))
+        visions = []
+        for start in range(0, days, stretch):
+            if not heeded():
+                return None
+            visions.append(self.foresee(vantage, date + timedelta(days=start), min(stretch, days - start), destinations, cadence, adaptive, twilight))
+        return Vision.join(visions)
+
+    '''
+    BEHAVIOUR:
+    Foretells the prophecy for each day of a day range, in day order, as soon as it is known (so whoever is listening can get on with it without waiting for the whole range).
+    Idmon first recalls what he foresaw for the previous window (so when the window slides by a day, all but one of the days are still in mind), then asks Mnemosyne. Remembered days are foretold straight away; on reaching a day that is (in any part) forgotten he goes to the almanac for a chunk of days from there, and whatever is freshly foreseen is given to Mnemosyne to remember.
+    By default the chunk is the whole range (the almanac is best consulted in bulk), but a listener who wants to see the first days quickly can ask for a small first chunk; which doubles in size with each visit to the almanac, up to max_chunk_days (or, with the Sibyls at hand, up to as many days as they can foresee at once).
+    The arcs are sampled at the given cadence (in minutes), or adaptively (see _sharpen).
+    A listener who may lose interest part way (heeded telling whether they still want the range) is only foretold days while they do: the almanac is visited a stretch (or a sibyl's shard) at a time, and the foretelling abandoned as soon as they don't.
+    '''
+    def divine_days(self, vantage, date, days, destinations, chunk_days=None, cadence=60, adaptive=False, heeded=None):
+        adaptive = adaptive and cadence < 60
+        dates = [date + timedelta(days=day) for day in range(days)]
+        target_ids = [
+            Mnemosyne.sampled(Mnemosyne.target_id(destination, glanced=self.fast_stars), cadence, adaptive)
+            for destination in destinations
+        ]
+        lunar = Mnemosyne.sampled(Mnemosyne.lunar, cadence, adaptive)
+        aspects = [lunar, Mnemosyne.twilight] + target_ids
+
+        wanted = [(day_date, aspect) for day_date in dates for aspect in aspects]
+
+        # whatever we foresaw for the last window, from the same vantage, is still fresh in mind...
+        memories = {}
+        recent_vantage, recent = self.recent
+        if vantage == recent_vantage:
+            memories = {want: recent[want] for want in wanted if want in recent}
+
+        # ...and Mnemosyne may remember the rest
+        if self.mnemosyne:
+            memories.update(self.mnemosyne.recall(vantage, [want for want in wanted if want not in memories]))
+
+        def forgotten(day):
+            return any((dates[day], aspect) not in memories for aspect in aspects)
+
+        max_chunk_days = self.max_chunk_days
+        if self.sibyls:
+            max_chunk_days = max(max_chunk_days, self.sibyls.shard_days * self.sibyls.workers)
+
+        chunk_days = chunk_days or days
+        for day in range(days):
+            if forgotten(day):
+                # a chunk of days from here, but only as far as the last of them that's forgotten
+                span_end = max(later for later in range(day, min(day + chunk_days, days)) if forgotten(later)) + 1
+                foreseen = self._foresee(vantage, dates[day:span_end], destinations, lunar, target_ids, memories, cadence, adaptive, heeded)
+                if foreseen is None:
+                    return
+                memories.update(foreseen)
+                if self.mnemosyne:
+                    self.mnemosyne.inscribe(vantage, foreseen)
+                chunk_days = min(chunk_days * 2, max(max_chunk_days, chunk_days))
+
+            yield day, self._prophesy(memories, dates[day], lunar, target_ids)
+
+        # keep this window in mind (and only this window), for when it slides
+        self.recent = (dict(vantage), {want: memories[want] for want in wanted})
 
     '''
     MECHANISM:
-    Works out the daily event times, e.g. sunrise et al. on the transit date
-    provides a list of (9) start/end times-of-day periods consulting Kairos to prescribe the type of the time-period (day, night, etc...)
+    Gathers a single day's prophecy from what is known. Every arc (the moon's illumination included) comes as its own (hours, values) pair, since adaptively sampled arcs needn't share their hours with anything else.
+    '''
+    def _prophesy(self, memories, day_date, lunar, target_ids):
+        moon_arc, illumination = memories[(day_date, lunar)]
+        target_arcs = [memories[(day_date, target_id)] for target_id in target_ids]
+        return moon_arc, illumination, target_arcs, memories[(day_date, Mnemosyne.twilight)]
+
+    '''
+    MECHANISM:
+    Foresees a (contiguous) span of dates, but only those destinations, and the twilight, that aren't already remembered for every date in the span. The lunar arc comes for free with the heavy-lifting, so we always take it.
+    A span longer than a single shard is shared out among the Sibyls, if they have been summoned.
+    Provides the foreseen per-day results keyed by (date, aspect), just as Mnemosyne would; or nothing at all, should the listener lose interest (see divine_days).
+    '''
+    def _foresee(self, vantage, span, destinations, lunar, target_ids, memories, cadence, adaptive, heeded=None):
+        def forgotten(aspect):
+            return any((day_date, aspect) not in memories for day_date in span)
+
+        unseen = [i for i, target_id in enumerate(target_ids) if forgotten(target_id)]
+        sought = (vantage, span[0], len(span), [destinations[i] for i in unseen], cadence, adaptive, forgotten(Mnemosyne.twilight))
+        if self.sibyls and len(span) > self.sibyls.shard_days:
+            vision = self.sibyls.foresee(*sought, heeded=heeded)
+        elif heeded is not None:
+            vision = self.foresee_heeded(*sought, heeded)
+        else:
+            vision = self.foresee(*sought)
+        if vision is None:
+            return None
+
+        foreseen = {}
+        for day, day_date in enumerate(span):
+            foreseen[(day_date, lunar)] = (vision.moon_arcs[day], vision.illumination[day])
+            for arcs, i in zip(vision.target_arcs, unseen):
+                foreseen[(day_date, target_ids[i])] = arcs[day]
+            if vision.twilight is not None:
+                foreseen[(day_date, Mnemosyne.twilight)] = vision.twilight[day]
+
+        return foreseen
+
+    '''
+    BEHAVIOUR:
+    Works out the daily event times, e.g. sunrise et al. for every day of the augury's day range, with a single search of the almanac across the whole range.
+    The transitions are then dealt out into each day's noon-to-noon window, giving (for each day) the start/end times-of-day of each period along with the oblique twilight band code that Kairos can interpret for us (day, night, etc...).
+    These come back compact: flat arrays of band starts, ends and codes for the whole range, with each day's bands being a view onto a slice of those.
     Whilst it doesn't attemt to differentiate between dusks and dawns that is to our advantage because neither do we! All that matters to us is the daylight level: true night, astronomical twilight, nautical twilght, etc.. whichever end of the day we find those levels.
     Logically speaking we get 9 of these per day. We can cope with fewer (like we might see near the poles) but we have a deeply grounded faith that no day (24 hour period) will see the sun rise twice. I think that's reasonable.
     '''
-    def get_twilight_bands(self):
-        # Anchor: local noon on the given date
-        utc_anchor = Kairos.true_hour(self.date, 0)
-        utc_end = Kairos.true_hour(self.date, 24)
+    def get_twilight_range(self, augury):
+        days = augury.days
+
+        # Anchors: local noon on each date, each window running for the following 24 hours (which is not always until the next noon, thanks to daylight saving)
+        # Skyfield time range... in a format that supports Julian dates which allows simplified (and vectorised) calculations.
+        window_start = augury.noons_tt
+        window_end = window_start + 1.0
+
+        # Get twilight transitions, for the whole range at once, along with the daylight level as each day begins
+        f = dark_twilight_day(self.ephemeris, augury.observer)
+        f.step_days = self.twilight_step_days
+        times, events = find_discrete(self.ts.tt_jd(window_start[0]), self.ts.tt_jd(window_end[-1]), f, epsilon=60 / 86400)
+        transitions = times.tt
+        opening_codes = f(self.ts.tt_jd(window_start))
+
+        # Near the poles we can see the whole range pass without the daylight level changing at all
+        if not len(transitions):
+            return [(np.array([0.0]), np.array([24.0]), opening_codes[day:day + 1]) for day in range(days)]
+
+        # Which of the transitions fall into each day's window
+        first = np.searchsorted(transitions, window_start, side='left')
+        last = np.searchsorted(transitions, window_end, side='right')
+
+        # Each day gets one more band than it has transitions
+        counts = last - first + 1
+        offsets = np.concatenate(([0], np.cumsum(counts)))
+        band_day = np.repeat(np.arange(days), counts)
+        band_num = np.arange(offsets[-1]) - offsets[band_day]
+
+        # A band starts at the transition before it (or at noon for the first band of the day) and ends at the transition after it (or 24 hours later for the last)
+        opened = np.clip(first[band_day] + band_num - 1, 0, len(transitions) - 1)
+        closed = np.clip(first[band_day] + band_num, 0, len(transitions) - 1)
+        is_first = band_num == 0
+        is_last = band_num == counts[band_day] - 1
+
+        starts = np.where(is_first, 0.0, (transitions[opened] - window_start[band_day]) * 24)
+        ends = np.where(is_last, 24.0, (transitions[closed] - window_start[band_day]) * 24)
+        codes = np.where(is_first, opening_codes[band_day], events[opened])
+
+        return [
+            (starts[offsets[day]:offsets[day + 1]], ends[offsets[day]:offsets[day + 1]], codes[offsets[day]:offsets[day + 1]])
+            for day in range(days)
+        ]
+
+# --- Sibyls: Oracles in Number ---
+'''
+FIGURATION:
+The Sibyls were the prophetesses of the ancient world; not one oracle but many, each in her own shrine.
+Ours are a pool of processes, each awakening with an Idmon of her own (and so her own copy of the almanac, loaded just the once). A long day range is split into shards of days, each shard is foreseen by whichever sibyl is free, and their visions are joined back together in day order. So a long range takes (roughly) its share of the days per core, rather than the lot.
+They are spawned rather than forked, so that none of them inherits the threads of whoever summoned them (The Observatory, say).
+The shard size is ours to choose: smaller shards share the work out more evenly, larger ones waste less on the passing of visions between processes.
+'''
+# KNOWLEDGE: the Idmon within each sibyl's shrine (i.e. one per process)
+_sibyl = None
+
+'''
+MECHANISM:
+Awakens a sibyl in her shrine, as the pool starts her process
+'''
+def _awaken_sibyl(fast_stars):
+    global _sibyl
+    _sibyl = Idmon(memory_path=None, fast_stars=fast_stars)
+
+'''
+MECHANISM:
+Consults a sibyl about her shard of days
+'''
+def _consult_sibyl(vantage, date, days, destinations, cadence, adaptive, twilight):
+    return _sibyl.foresee(vantage, date, days, destinations, cadence, adaptive, twilight)
+
+class Sibyls:
+    def __init__(self, workers=None, shard_days=32, fast_stars=False):
+        # KNOWLEDGE: how many sibyls there are (one per core, unless we say otherwise) and how many days each is asked about at a time
+        self.workers = workers or os.cpu_count()
+        self.shard_days = shard_days
+        self.fast_stars = fast_stars
+
+        # KNOWLEDGE: the pool of shrines, which is only built when first we need it
+        self.shrines = None
+
+    '''
+    MECHANISM:
+    Builds the shrines (the process pool) if they aren't already standing; each sibyl awakens as her process starts
+    '''
+    def _shrines(self):
+        if self.shrines is None:
+            self.shrines = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context('spawn'),
+                initializer=_awaken_sibyl,
+                initargs=(self.fast_stars,)
+            )
+        return self.shrines
 
-        # Skyfield time range... in a format that supports Julian dates which allows simplified (and vectorised) calculations. 
-        t0 = self.ts.utc(utc_anchor)
-        t1 = self.ts.utc(utc_end)
+    '''
+    BEHAVIOUR:
+    Shares a day range out among the Sibyls, a shard of days each, and hands back each shard's vision in day order as soon as it (and every shard before it) is foreseen.
+    Should whoever asked lose interest (heeded telling whether they still want the range) the shards not yet started are abandoned, and no more are handed back.
+    '''
+    def foresee_shards(self, vantage, date, days, destinations, cadence=60, adaptive=False, twilight=True, heeded=None):
+        shrines = self._shrines()
+        consultations = [
+            shrines.submit(
+                _consult_sibyl, dict(vantage), date + timedelta(days=start), min(self.shard_days, days - start),
+                destinations, cadence, adaptive, twilight
+            )
+            for start in range(0, days, self.shard_days)
+        ]
+        for number, consultation in enumerate(consultations):
+            if heeded is not None and not heeded():
+                for abandoned in consultations[number:]:
+                    abandoned.cancel()
+                return
+            yield consultation.result()
 
-        # Get twilight transitions
-        f = dark_twilight_day(self.ephemeris, self.observer)
-        times, events = find_discrete(t0, t1, f, epsilon=60 / 86400)
+    '''
+    BEHAVIOUR:
+    Just as Idmon.foresee, but with the day range shared out among the Sibyls; providing the one vision of the whole range (or nothing, if whoever asked loses interest before it is foreseen)
+    '''
+    def foresee(self, vantage, date, days, destinations, cadence=60, adaptive=False, twilight=True, heeded=None):
+        visions = list(self.foresee_shards(vantage, date, days, destinations, cadence, adaptive, twilight, heeded))
+        if heeded is not None and not heeded():
+            return None
+        return Vision.join(visions)
 
-        # Build bands
-        bands = []
+    '''
+    MECHANISM:
+    Dismisses the Sibyls, abandoning anything they have yet to start on
+    '''
+    def dismiss(self):
+        if self.shrines is not None:
+            self.shrines.shutdown(wait=False, cancel_futures=True)
+            self.shrines = None
 
-        if not times:
-            return [(0.0, 24.0, Kairos.get_day_band(4))]  # Default daylight
+# --- Hosios: Attendant of the Oracle ---
+'''
+FIGURATION:
+The Hosioi were the holy ones who attended the oracle at Delphi. Our Hosios attends Idmon in a chamber of his own (a separate thread), so that The Observatory isn't frozen while the almanac is consulted.
+He relays Idmon's prophecy a day at a time, as soon as each day is foretold, and he knows when to stop: if the petition he is attending is no longer the current one (because it has been superseded, or the oracle silenced) he abandons it.
+'''
+class Hosios(QObject):
+    # IMPULSE: a day has been foretold (for petition, day, prophecy)
+    foretold = pyqtSignal(int, int, object)
+    # IMPULSE: the whole of a petition has been foretold
+    fulfilled = pyqtSignal(int)
+
+    def __init__(self, idmon):
+        super().__init__()
+        self.idmon = idmon
+
+        # KNOWLEDGE: the petition we should be attending; set from The Observatory, who can change her mind at any moment
+        self.current = None
 
-        # First segment: from 12.0 to first transition
-        end = Kairos.utc_hours_difference(times[0].utc_datetime(), utc_anchor)
-        bands.append((0.0, end, Kairos.get_day_band(events[-1])))
+    '''
+    BEHAVIOUR:
+    Attends a petition to the oracle, relaying each day as it is foretold. Idmon is asked for a single day first (so there is something to see straight away), and then for ever bigger chunks of the range; heeding, as he goes, whether the petition is still the current one (so a superseded or silenced petition doesn't keep the next one waiting).
+    '''
+    def attend(self, petition, vantage, date, days, destinations, cadence):
+        if petition != self.current:
+            return
 
-        # Intermediate bands
-        for i in range(len(times) - 1):
-            start = Kairos.utc_hours_difference(times[i].utc_datetime(), utc_anchor)
-            end = Kairos.utc_hours_difference(times[i+1].utc_datetime(), utc_anchor)
-            bands.append((start, end, Kairos.get_day_band(events[i])))
+        minutes, adaptive = cadence
+        def heeded():
+            return petition == self.current
 
-        # Final segment
-        start = Kairos.utc_hours_difference(times[-1].utc_datetime(), utc_anchor)
-        bands.append((start, 24.0, Kairos.get_day_band(events[-1])))
-        return bands
+        for day, prophecy in self.idmon.divine_days(vantage, date, days, destinations, chunk_days=1, cadence=minutes, adaptive=adaptive, heeded=heeded):
+            if petition != self.current:
+                return
+            self.foretold.emit(petition, day, prophecy)
+
+        # an abandoned petition is never fulfilled, however much of it was foretold
+        if petition != self.current:
+            return
+        self.fulfilled.emit(petition)
 
 # --- Main Storyteller UI ---
 '''
 AFFORDANCE:
 On this quest everybody works within The Observatory.
-It allows queries to be resolved on a day-by-day basis. Each of the attendants concentrate on a given day, as sequenced by the query presented.
+It allows queries to be resolved on a day-by-day basis. Each of the attendants concentrate on a given day, as sequenced by the query presented; with the oracle itself being consulted away from the main hall, so The Observatory stays responsive while the days are foretold.
 Each of the key players provide their own control panels: vantage and targets from Tiphys; date and range from Chronos; Various plot settings from Astreus.  The observatory itself presents the master control (the hosios - attending the prophet Idmon - button).
 '''
 class Observatory(QWidget):
+    # IMPULSE: a petition to the oracle (petition, vantage, date, days, destinations, (cadence, adaptive))
+    petition = pyqtSignal(int, object, object, int, object, object)
+
     def __init__(self, app_name):
         super().__init__()
         self.setWindowTitle(app_name)
@@ -313,7 +1005,9 @@ class Observatory(QWidget):
         chronos_row = QHBoxLayout()
         self.chronos = Chronos()
         chronos_row.addWidget(self.chronos)
-        self.chronos.telos = self.present_query
+        # the Horae keep the gate between Chronos and the quest, so a flurry of time-flux only presents the one query
+        self.horae = Horae(self.present_query)
+        self.chronos.telos = self.horae.request
         QShortcut(QKeySequence(Qt.Key_Left), self).activated.connect(lambda: self.chronos.arche_flux(-1))
         QShortcut(QKeySequence(Qt.Key_Right), self).activated.connect(lambda: self.chronos.arche_flux(1))
         # QShortcut(QKeySequence(Qt.Key_Down), self).activated.connect(lambda: self.chronos.aion_flux(-1))
@@ -326,61 +1020,114 @@ class Observatory(QWidget):
         self.layout.addWidget(chronos_container)
 
 
+        oracle_row = QHBoxLayout()
         self.hosios_button = QPushButton("Summon the Oracle")
-        self.hosios_button.clicked.connect(self.present_query)
-        self.layout.addWidget(self.hosios_button)
+        self.hosios_button.clicked.connect(self.horae.hasten)
+        oracle_row.addWidget(self.hosios_button)
+
+        self.silence_button = QPushButton("Silence the Oracle")
+        self.silence_button.setEnabled(False)
+        self.silence_button.clicked.connect(self.silence_oracle)
+        oracle_row.addWidget(self.silence_button)
+        self.layout.addLayout(oracle_row)
 
         self.layout.addWidget(self.astraeus.artboard)
 
         self.setLayout(self.layout)
 
-        self.idmon = Idmon()
+        # The oracle is attended in a chamber of its own, from where the prophecy arrives day by day
+        # (with more than one core to hand, the Sibyls share out the longer ranges)
+        self.sibyls = Sibyls() if os.cpu_count() > 1 else None
+        self.idmon = Idmon(sibyls=self.sibyls)
+        self.hosios = Hosios(self.idmon)
+        self.oracle_chamber = QThread()
+        self.hosios.moveToThread(self.oracle_chamber)
+        self.petition.connect(self.hosios.attend)
+        self.hosios.foretold.connect(self.present_day)
+        self.hosios.fulfilled.connect(self.complete_query)
+        self.oracle_chamber.start()
+
+        # KNOWLEDGE: the current petition to the oracle (just a count), and the first date it concerns
+        self.query = 0
+        self.query_date = None
 
     '''
     BEHAVIOUR:
     THIS is the telos, the fulfillment of our destiny. 
-    Sets up the specific observation requested then steps through the day range to marshal the skills of Idmon and Astraeus to build-up the results.
-    Finally calling on Astraeus to complete the works and present the plot
+    Sets up the specific observation requested and petitions the oracle for the whole day range. Any petition still being attended is superseded; whatever it has yet to foretell will be abandoned.
+    The days are presented as they are foretold (see present_day) and the works are completed once the oracle is done (see complete_query).
     '''
     def present_query(self):
-        # Right now we only have 1 grouped option, the planets
-        # so Tiphys doesn't bother to give us a name for a group of destinations!!!
-        name = "Major Planets"
-        if len(self.tiphys.destination) == 1:
-            name = self.tiphys.destination[0]["name"]
+        name = Tiphys.designation(self.tiphys.destination)
 
         date = self.chronos.arche_date
         days = self.chronos.aion
-        self.astraeus.commence_presentation(name, date, days)
-        for day in range(days):
-            # Set transit
-            moon_arc, illumination = self.idmon.set_transit(self.tiphys.vantage, date)
-
-            twilight = self.idmon.get_twilight_bands()
-
-            # get target arcs
-            target_arcs = []
-            for arc_num, destination in enumerate(self.tiphys.destination):
-                target_arc = self.idmon.get_transit_arc(destination)
-                target_arcs.append(target_arc)
-
-            labels = [Kairos.what_time_is_it(date, h) for h in range(25)]
-
-            # Draw arcs and such
-            self.astraeus.draw_day(
-                day,
-                labels,
-                target_arcs,
-                moon_arc,
-                illumination,
-                twilight
-            )
 
-            # step to next day of intest
-            date += timedelta(days=1)
+        # days already drawn for the same sighting (what we look at, from where, and how closely) needn't be drawn again
+        cadence = (self.chronos.cadence, self.chronos.adaptive)
+        sighting = (self.tiphys.vantage, [destination["name"] for destination in self.tiphys.destination], cadence)
+        self.astraeus.commence_presentation(name, date, days, sighting)
+
+        self.query += 1
+        self.query_date = date
+        self.hosios.current = self.query
+        self.hosios_button.setToolTip(self.horae.tally)
+        self.silence_button.setEnabled(True)
+        self.petition.emit(self.query, self.tiphys.vantage, date, days, self.tiphys.destination, cadence)
 
+    '''
+    IMPULSE:
+    A day has been foretold; so long as it belongs to the current petition, Astraeus presents it straight away.
+    '''
+    def present_day(self, query, day, prophecy):
+        if query != self.query:
+            return
+
+        moon_arc, illumination, target_arcs, twilight = prophecy
+        labels = Kairos.hour_labels(self.query_date + timedelta(days=day))
+
+        # Draw arcs and such
+        self.astraeus.present_day(
+            day,
+            labels,
+            target_arcs,
+            moon_arc,
+            illumination,
+            twilight
+        )
+
+    '''
+    IMPULSE:
+    The oracle has foretold the whole of the current petition, so Astraeus can complete the works and present the plot
+    '''
+    def complete_query(self, query):
+        if query != self.query:
+            return
+
+        self.silence_button.setEnabled(False)
         self.astraeus.complete_presentation()
 
+    '''
+    BEHAVIOUR:
+    Abandons the current petition; whatever days have been foretold so far are all we get.
+    '''
+    def silence_oracle(self):
+        self.hosios.current = None
+        self.complete_query(self.query)
+        self.query += 1
+
+    '''
+    IMPULSE:
+    When The Observatory closes, the oracle's chamber is closed too (once Idmon has finished whatever he's in the middle of)
+    '''
+    def closeEvent(self, event):
+        self.hosios.current = None
+        self.oracle_chamber.quit()
+        self.oracle_chamber.wait()
+        if self.sibyls:
+            self.sibyls.dismiss()
+        super().closeEvent(event)
+
 # --- Run the Quest ---
 '''
 BEHAVIOUR: